@@ -0,0 +1,148 @@
+import random
+import re
+import unittest
+from unittest import mock
+import text_cleanup
+from text_cleanup import MultiLanguageTextCleaner, CLEANUP_PATTERNS, UNIVERSAL_PATTERNS
+
+LANGUAGES = ['french', 'romanian', 'english', 'german']
+
+# Non-pattern text mixed into the generated lines: multi-line structure, Unicode
+# digits and whitespace, and letters re.IGNORECASE folds in special ways
+EXTRA_FRAGMENTS = [
+    '12,5%', '٣٤,٥%', '१२.५%', '@user', '#Tag', '#1', 'http://x.ro/a', 'www.a.b', '[t](u)',
+    '<a href="x">y</a>', 'Home > News', 'News | Politics', '> Article', 'remaining', 'rEmaining',
+    'POLİTİQUE', 'ıl vous', 'İ', 'ı', 'ß', 'K', 'ſ', 'Ştiri', 'ș', '\u00a0', '\u2028', '\u3000',
+    '\x1c', '\x85', '\t', '  ', '.', 'x', "Texte normal de l'article.", 'Acesta este un text.',
+]
+
+# Lines that tripped one backend or another: İ and ı case-fold to i under re, and
+# \d matches every Unicode decimal digit
+EDGE_CASE_TEXTS = [
+    'Primul paragraf.\nİNews | Politics\nUltimul paragraf.',
+    'Texte.\nPOLİTİQUE DE CONFİDENTİALİTÉ\nPOLıTıQUE DE CONFıDENTıALıTÉ\nSuite du texte.',
+    "Texte de l'article.\nIl vous reste ٣٤,٥% de cet article à lire.\nTexte caché.",
+    'Intro text.\n१२.५% remaining\n٣,٥% of the content\nMore text here.',
+]
+
+
+def reference_clean_text(cleaner, text, language, stop_at_paywall=True):
+    """What clean_text did line by line, one re.search per pattern, before the patterns were fused"""
+    patterns = CLEANUP_PATTERNS.get(language, {})
+    paywall_patterns = patterns.get('subscription_walls', []) if stop_at_paywall else []
+    skip_patterns = [p for category, category_patterns in patterns.items()
+                     if category != 'subscription_walls' for p in category_patterns]
+    skip_patterns += [p for category_patterns in UNIVERSAL_PATTERNS.values() for p in category_patterns]
+    cleaned_lines = []
+    for line in text.split('\n'):
+        stripped_line = line.strip()
+        if stripped_line and any(re.search(p, stripped_line, re.IGNORECASE) for p in paywall_patterns):
+            break
+        if not stripped_line or not any(re.search(p, stripped_line, re.IGNORECASE) for p in skip_patterns):
+            cleaned_lines.append(stripped_line)
+    return cleaner.post_process_text('\n'.join(cleaned_lines))
+
+
+def pattern_fragments():
+    """The literal pieces of every cleanup pattern, so generated lines hit the patterns often"""
+    fragments = set()
+    for pattern_table in [UNIVERSAL_PATTERNS] + list(CLEANUP_PATTERNS.values()):
+        for category_patterns in pattern_table.values():
+            for pattern in category_patterns:
+                fragments.update(f.strip() for f in re.split(r'\\[a-zA-Z]|[.^$*+?{}\[\]()|\\]+', pattern) if f.strip())
+    return sorted(fragments)
+
+
+def generate_texts(seed, count):
+    """Multi-line texts of pattern fragments and extra text in mixed case, joined by assorted whitespace"""
+    rng = random.Random(seed)
+    fragments = pattern_fragments()
+
+    def line():
+        parts = []
+        for _ in range(rng.randint(1, 5)):
+            part = rng.choice(fragments if rng.random() < 0.6 else EXTRA_FRAGMENTS)
+            case = rng.random()
+            if case < 0.2:
+                part = part.upper()
+            elif case < 0.35:
+                part = part.lower()
+            elif case < 0.45:
+                part = part.swapcase()
+            parts.append(part)
+        return rng.choice([' ', '', ' \u00a0', '\t']).join(parts)
+
+    return ['\n'.join(line() if rng.random() < 0.85 else rng.choice(['', '  ', '\u3000'])
+                      for _ in range(rng.randint(1, 12)))
+            for _ in range(count)]
+
+
+class CleanupTestCase(unittest.TestCase):
+    def assert_matches_reference(self, cleaner, texts):
+        for text in texts:
+            for language in LANGUAGES:
+                for stop_at_paywall in (True, False):
+                    self.assertEqual(cleaner.clean_text(text, language=language, stop_at_paywall=stop_at_paywall),
+                                     reference_clean_text(cleaner, text, language, stop_at_paywall),
+                                     f"{language}, stop_at_paywall={stop_at_paywall}: {text!r}")
+
+
+class TestTextCleanup(CleanupTestCase):
+    def test_clean_text_matches_per_pattern_reference(self):
+        self.assert_matches_reference(MultiLanguageTextCleaner(), EDGE_CASE_TEXTS + generate_texts(0, 1000))
+
+    def test_clean_text_removes_lines_and_stops_at_paywall(self):
+        text = ("Primul paragraf al articolului.\nCitește și: Alt articol\n  Al doilea paragraf.  \n"
+                "Articol disponibil doar pentru abonați.\nText după paywall.")
+        cleaned = MultiLanguageTextCleaner().clean_text(text, language='romanian')
+        self.assertEqual(cleaned, "Primul paragraf al articolului.\nAl doilea paragraf.")
+
+
+class TestLineFilterBackends(CleanupTestCase):
+    """Each matching backend, forced by hiding the ones before it, gives the per-pattern reference output"""
+
+    def setUp(self):
+        self.texts = EDGE_CASE_TEXTS + generate_texts(1, 400)
+        self.addCleanup(text_cleanup.build_cleanup_filters.cache_clear)
+
+    def cleaner_with(self, hyperscan=False, ahocorasick=False, re2=False):
+        for flag, available in [('HYPERSCAN_AVAILABLE', hyperscan), ('AHOCORASICK_AVAILABLE', ahocorasick),
+                                ('RE2_AVAILABLE', re2)]:
+            patcher = mock.patch.object(text_cleanup, flag, available)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        text_cleanup.build_cleanup_filters.cache_clear()
+        return MultiLanguageTextCleaner()
+
+    @unittest.skipUnless(text_cleanup.HYPERSCAN_AVAILABLE, "hyperscan not installed")
+    def test_hyperscan(self):
+        cleaner = self.cleaner_with(hyperscan=True)
+        self.assertIsNotNone(cleaner.universal_filter.database)
+        self.assert_matches_reference(cleaner, self.texts)
+
+    @unittest.skipUnless(text_cleanup.AHOCORASICK_AVAILABLE, "pyahocorasick not installed")
+    def test_ahocorasick_prefilter_with_re(self):
+        cleaner = self.cleaner_with(ahocorasick=True)
+        self.assertIsNotNone(cleaner.universal_filter.keywords)
+        self.assert_matches_reference(cleaner, self.texts)
+
+    @unittest.skipUnless(text_cleanup.AHOCORASICK_AVAILABLE and text_cleanup.RE2_AVAILABLE,
+                         "pyahocorasick or google-re2 not installed")
+    def test_ahocorasick_prefilter_with_re2(self):
+        cleaner = self.cleaner_with(ahocorasick=True, re2=True)
+        self.assertIsNotNone(cleaner.universal_filter.keywords)
+        self.assert_matches_reference(cleaner, self.texts)
+
+    @unittest.skipUnless(text_cleanup.RE2_AVAILABLE, "google-re2 not installed")
+    def test_re2(self):
+        cleaner = self.cleaner_with(re2=True)
+        self.assertNotIsInstance(cleaner.universal_filter.regex, re.Pattern)
+        self.assert_matches_reference(cleaner, self.texts)
+
+    def test_re(self):
+        cleaner = self.cleaner_with()
+        self.assertIsInstance(cleaner.universal_filter.regex, re.Pattern)
+        self.assert_matches_reference(cleaner, self.texts)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import contextlib
+import copy
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+import yaml
+import text_extractor
+from text_extractor import TextExtractor, dump_metadata_yaml
+
+class TestTextExtractor(unittest.TestCase):
+    def setUp(self):
+        self.extractor = TextExtractor(load_processed_status=False)
+
+    def test_preserve_html_formatting_converts_tags_after_underline_with_children(self):
+        html = '<p><b>bold</b> <u>see <code>x</code></u></p>'
+        formatted = self.extractor.preserve_html_formatting(html)
+        self.assertIn('**bold**', formatted)
+        self.assertIn('<u>see x</u>', formatted)
+        self.assertNotIn('<b>', formatted)
+        self.assertNotIn('<code>', formatted)
+
+    def test_clean_html_for_extraction_returns_empty_for_page_without_text(self):
+        html = ('<html><head><script>app()</script></head><body><div id="root"></div>'
+                '<noscript>Enable JS</noscript></body></html>')
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            cleaned = self.extractor.clean_html_for_extraction(html)
+        self.assertEqual(cleaned, '')
+        self.assertEqual(output.getvalue(), '')
+
+    def test_dump_metadata_yaml_round_trips_characters_yaml_rejects(self):
+        # DEL and C1 controls, NEL, the Unicode line and paragraph separators and the noncharacters
+        for character in ['\x7f', '\x85', '\x9f', '\u2028', '\u2029', '\ufffe', '\uffff']:
+            metadata = {'title': f'a{character}b', 'word_count': 2, 'has_custom_sections': False}
+            self.assertEqual(yaml.safe_load(dump_metadata_yaml(metadata)), metadata)
+
+    def test_dump_metadata_yaml_round_trips_json_escaped_strings(self):
+        metadata = {'title': 'Titlu: "ăîșț" \\ é\t\n\x01', 'author': '', 'url': 'https://www.digi24.ro/a#b'}
+        self.assertEqual(yaml.safe_load(dump_metadata_yaml(metadata)), metadata)
+
+    def test_extraction_worker_does_not_load_status(self):
+        with mock.patch.object(TextExtractor, 'load_status', side_effect=AssertionError("status loaded")):
+            text_extractor.init_extraction_worker('trafilatura', False, False)
+        self.assertEqual(text_extractor.worker_extractor.processed_status, {})
+
+    def test_process_html_files_in_parallel_matches_sequential(self):
+        # Outputs, logs and the status journal are all written relative to the working directory
+        previous_directory = os.getcwd()
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        os.chdir(temporary_directory.name)
+        self.addCleanup(os.chdir, previous_directory)
+        
+        raw_dir = os.path.join(text_extractor.CONTENT_DIR, 'www.digi24.ro', '2024', 'raw')
+        os.makedirs(raw_dir)
+        paragraphs = ''.join(f'<p>Paragraful {i} al articolului are destul text pentru a fi extras ca atare.</p>' for i in range(8))
+        pages = {
+            'article-1.html': f'<html><head><title>Primul articol</title></head><body><article>{paragraphs}</article></body></html>',
+            'article-2.html': f'<html><head><title>Al doilea articol</title></head><body><article>{paragraphs}</article></body></html>',
+            'too-small.html': '<html><body><p>Scurt.</p></body></html>',
+            'skipped-before.html': '<html><body><p>Tot scurt.</p></body></html>',
+        }
+        files = []
+        for name, page in pages.items():
+            file_path = os.path.join(raw_dir, name)
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(page)
+            files.append((file_path, 'www.digi24.ro'))
+        
+        with contextlib.redirect_stdout(io.StringIO()):
+            # A previous run skipped the last file, its entry has the same size and mtime
+            previous_run = TextExtractor(extraction_method='trafilatura', workers=1, load_processed_status=False)
+            previous_run.process_html_files(files[-1:])
+            previous_status = previous_run.processed_status
+            self.assertIn('mtime', previous_status[f'www.digi24.ro:{files[-1][0]}'])
+            
+            results = []
+            for workers in (1, 2):
+                extractor = TextExtractor(extraction_method='trafilatura', workers=workers, load_processed_status=False)
+                extractor.processed_status = copy.deepcopy(previous_status)
+                extractor.process_html_files(files)
+                extractor.save_status()
+                extractor.close_skip_logs()
+                status = {key: {name: value for name, value in entry.items() if name != 'processed_at'}
+                          for key, entry in extractor.processed_status.items()}
+                results.append((status, extractor.stats))
+        
+        self.assertEqual(results[0][1]['already_processed'], 1)
+        self.assertEqual(results[0][1]['successful_extractions'], 2)
+        self.assertEqual(results[1], results[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,215 +7,577 @@ Multi-language patterns for cleaning extracted article content.
 import re
 import yaml
 import os
+import logging
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# Leading/trailing whitespace of every line (never the line break itself)
+LINE_EDGE_WHITESPACE = re.compile(r'^[^\S\n]+|[^\S\n]+$', re.MULTILINE)
+
+# Everything \s matches except the newline, spelled out so RE2 (whose \s is
+# ASCII-only) and re agree on it
+LINE_WHITESPACE = '\t\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+
+# Language detection markers, matched against whole words of the text sample
+LANGUAGE_SAMPLE_SIZE = 4096
+WORD = re.compile(r'\w+')
+ROMANIAN_MARKERS = frozenset({'și', 'cu', 'pentru', 'este', 'sunt', 'într'})  # 'într' from într-un/într-o
+FRENCH_MARKERS = frozenset({'avec', 'pour', 'dans', 'cette', 'vous', 'nous', 'être'})
+
+# casefold() turns İ into i plus a combining dot above and leaves ı alone, where
+# re's IGNORECASE matches both to i; the keyword prefilter folds them to i as well
+DOTTED_AND_DOTLESS_I = str.maketrans({'ı': 'i', '\u0307': None})
+
+# Whitespace normalization used by post_process_text
+MULTIPLE_NEWLINES = re.compile(r'\n{3,}')
+SPACES_AND_TABS = re.compile(r'[ \t]+')
+SHORT_LINES = re.compile(r'^.{1,3}$\n?', re.MULTILINE)
+
+
+def confine_to_line(pattern):
+    """
+    Rewrite a pattern written for a single line so it can't run past a line
+    break when searched over a whole multi-line text: \\s, \\W, \\D and negated
+    character classes no longer match a newline.
+    """
+    replacements = {'\\s': f'[{LINE_WHITESPACE}]', '\\W': r'[^\w\n]', '\\D': r'[^\d\n]'}
+    result = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escape = pattern[i:i + 2]
+            if in_class:
+                result.append(LINE_WHITESPACE if escape == '\\s' else escape)
+            else:
+                result.append(replacements.get(escape, escape))
+            i += 2
+            continue
+        if in_class:
+            if char == ']':
+                in_class = False
+        elif char == '[':
+            in_class = True
+            if pattern.startswith('[^', i):
+                result.append('[^\\n')
+                i += 2
+                continue
+        result.append(char)
+        i += 1
+    return ''.join(result)
+
+
+@lru_cache(maxsize=None)
+def decimal_digits():
+    """Every character re's \\d matches, as character class ranges (Unicode has no decimal digits past plane 1)"""
+    return ''.join(f'{digits[0]}-{digits[-1]}' for digits in re.findall(r'\d+', ''.join(map(chr, range(0x20000)))))
+
+
+def match_like_re(pattern):
+    """
+    Rewrite a case-insensitive pattern for RE2 and Hyperscan so they match the
+    characters re does: \\d and \\D become the decimal digits of re's Unicode
+    version (RE2's \\d is ASCII-only, Hyperscan's an older Unicode), and İ and ı
+    match wherever i does, which their case folding leaves out
+    """
+    digits = decimal_digits()
+    result = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escape = pattern[i:i + 2]
+            result.append({'\\d': f'[{digits}]', '\\D': f'[^{digits}]'}.get(escape, escape))
+            i += 2
+        elif pattern.startswith('(?', i):
+            # Inline flags like (?im) and (?s: are not letters to match
+            end = i + 2
+            while pattern[end].isalpha() or pattern[end] == '-':
+                end += 1
+            result.append(pattern[i:end])
+            i = end
+        elif char == '[':
+            end = i + 2 if pattern.startswith('[^', i) else i + 1
+            if pattern[end] == ']':
+                end += 1  # A leading ] is a literal
+            while pattern[end] != ']':
+                end += 2 if pattern[end] == '\\' else 1
+            character_class = pattern[i:end + 1]
+            # A class matching i gets İ and ı added, and so does a negated class excluding i
+            adds_i = bool(re.fullmatch(character_class, 'i', re.IGNORECASE)) != character_class.startswith('[^')
+            character_class = character_class.replace('\\d', digits)
+            result.append(character_class[:-1] + 'İı]' if adds_i else character_class)
+            i = end + 1
+        else:
+            result.append('[iİı]' if char in 'iI' else char)
+            i += 1
+    return ''.join(result)
+
+
+def compile_regex(pattern):
+    """Compile with RE2 (linear-time matching) when available, falling back to re for what RE2 can't parse"""
+    if RE2_AVAILABLE:
+        options = re2.Options()
+        options.log_errors = False
+        try:
+            return re2.compile(match_like_re(pattern), options)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+def compile_line_filter(patterns, stop_patterns=()):
+    """Compile line patterns into one regex matching (and consuming) every whole line any of them matches
+
+    A line matched by one of stop_patterns is consumed together with the rest
+    of the text after it.
+    """
+    branches = []
+    if stop_patterns:
+        # Both branches start at the line start, so the stop branch wins
+        # whenever the line matches it
+        stop_alternation = factor_alternation([confine_to_line(pattern) for pattern in stop_patterns])
+        branches.append(rf'.*?(?:{stop_alternation})(?s:.*)')
+    if patterns:
+        # Patterns are confined to their line, so no lookahead is needed to keep
+        # the match from spilling into the next one
+        alternation = factor_alternation([confine_to_line(pattern) for pattern in patterns])
+        branches.append(rf'.*?(?:{alternation}).*\n?')
+    return compile_regex(rf'(?im)^(?:{"|".join(branches)})')
+
+
+def split_literal_prefix(pattern):
+    """Split a pattern into the literal text every match starts with and the regex matching the rest"""
+    if re.search(r'(?<!\\)\|', re.sub(r'\[[^\]]*\]', '', pattern)):
+        return '', pattern  # Top-level alternation, no common prefix
+    prefix = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        end = i + 1
+        if char == '\\':
+            if end >= len(pattern) or pattern[end].isalnum():
+                break  # Character class shorthand like \d or \s
+            char = pattern[end]
+            end += 1
+        elif char in '.^$*+?{}[]()|':
+            break
+        if end < len(pattern) and pattern[end] in '*+?{':
+            break  # Quantified character, left to the rest of the pattern
+        prefix.append(char)
+        i = end
+    return ''.join(prefix), pattern[i:]
+
+
+def literal_prefix(pattern):
+    """Return the literal text every match of a pattern starts with ('' if it has none)"""
+    return split_literal_prefix(pattern)[0]
+
+
+def factor_alternation(patterns):
+    """Join patterns into one alternation with their literal prefixes merged into a trie
+
+    re tries alternatives one after the other, so patterns sharing a prefix
+    like 'Partager sur ' would each re-match it at every position.
+    """
+    trie = {}
+    for pattern in patterns:
+        prefix, rest = split_literal_prefix(pattern)
+        node = trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(f'(?:{rest})' if rest else '')
+
+    def branches(node):
+        node_branches = list(node.get(None, []))
+        for char, child in node.items():
+            if char is not None:
+                child_branches = branches(child)
+                if len(child_branches) == 1:
+                    node_branches.append(re.escape(char) + child_branches[0])
+                else:
+                    node_branches.append(re.escape(char) + f'(?:{"|".join(child_branches)})')
+        return node_branches
+
+    return '|'.join(branches(trie))
+
+
+def fold_case(text):
+    """Case-fold text for the keyword prefilter, so every keyword a pattern matches under re.IGNORECASE is found"""
+    folded = text.casefold()
+    if 'ı' in folded or '\u0307' in folded:
+        folded = folded.translate(DOTTED_AND_DOTLESS_I)
+    return folded
+
+
+@lru_cache(maxsize=256)
+def load_compiled_domain_rules(domain):
+    """Load a domain's cleanup patterns once per process, compiled and flattened in file order"""
+    domain_rules = MultiLanguageTextCleaner.load_domain_cleanup_rules(domain)
+    return tuple(
+        re.compile(pattern, re.MULTILINE | re.IGNORECASE)
+        for patterns in domain_rules.values()
+        for pattern in patterns
+    )
+
+
+class LineFilter:
+    """Removes every line of a text matched by any of a group of single-line patterns
+
+    Text from the first line matched by one of the optional stop patterns
+    onwards is dropped as well, in the same scan.
+    """
+
+    # Shortest literal worth handing to the keyword prefilter
+    MIN_KEYWORD_LENGTH = 3
+
+    def __init__(self, patterns, stop_patterns=()):
+        self.regex = compile_line_filter(patterns, stop_patterns)
+        self.database = None
+        self.keywords = None
+        self.residual_regex = None
+
+        # Hyperscan scans the text once for all patterns together
+        if HYPERSCAN_AVAILABLE:
+            self.database = self.compile_database(list(patterns) + list(stop_patterns))
+            self.first_stop_id = len(patterns)
+            if self.database is not None:
+                return
+
+        # Patterns starting with a literal keyword can only match when the keyword
+        # occurs in the text, which an Aho-Corasick automaton checks in one pass
+        if AHOCORASICK_AVAILABLE:
+            keywords = [literal_prefix(pattern).casefold() for pattern in list(patterns) + list(stop_patterns)]
+            residual = [pattern for pattern, keyword in zip(patterns, keywords)
+                        if len(keyword) < self.MIN_KEYWORD_LENGTH]
+            residual_stop = [pattern for pattern, keyword in zip(stop_patterns, keywords[len(patterns):])
+                             if len(keyword) < self.MIN_KEYWORD_LENGTH]
+            if len(residual) + len(residual_stop) < len(keywords):
+                self.keywords = ahocorasick.Automaton()
+                for keyword in keywords:
+                    if len(keyword) >= self.MIN_KEYWORD_LENGTH:
+                        self.keywords.add_word(keyword, keyword)
+                self.keywords.make_automaton()
+                if residual or residual_stop:
+                    self.residual_regex = compile_line_filter(residual, residual_stop)
+
+    @staticmethod
+    def compile_database(patterns):
+        """Compile patterns into a Hyperscan block-mode database (None if Hyperscan rejects one of them)"""
+        # A trailing .* only makes Hyperscan report one match per remaining character
+        expressions = [match_like_re(re.sub(r'\.\*\$?$', '', confine_to_line(pattern))).encode('utf-8') for pattern in patterns]
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        database = hyperscan.Database()
+        try:
+            database.compile(expressions=expressions, ids=list(range(len(expressions))),
+                             elements=len(expressions), flags=[flags] * len(expressions))
+        except hyperscan.error:
+            return None
+        return database
+
+    def remove_lines_with_hyperscan(self, text):
+        """Scan the text once with the Hyperscan database and drop every line a match ends in"""
+        data = text.encode('utf-8')
+        line_starts = set()
+        stop = []
+
+        def on_match(pattern_id, start, end, flags, context):
+            # Patterns are confined to their line, so the match ends on the line it started on
+            line_start = data.rfind(b'\n', 0, end) + 1
+            if pattern_id >= self.first_stop_id:
+                # Matches come in end offset order, nothing before this line is left to report
+                stop.append(line_start)
+                return True
+            line_starts.add(line_start)
+
+        try:
+            self.database.scan(data, match_event_handler=on_match)
+        except hyperscan.ScanTerminated:
+            data = data[:stop[0]]
+        if not line_starts:
+            return data.decode('utf-8') if stop else text
+
+        kept = []
+        position = 0
+        for line_start in sorted(line_starts):
+            kept.append(data[position:line_start])
+            line_end = data.find(b'\n', line_start)
+            position = len(data) if line_end == -1 else line_end + 1
+        kept.append(data[position:])
+        return b''.join(kept).decode('utf-8')
+
+    @staticmethod
+    def remove_matches(regex, text):
+        """Remove every match of regex from text"""
+        if isinstance(regex, re.Pattern):
+            return regex.sub('', text)
+        # RE2 matches UTF-8 natively, on str it pays for converting the text
+        # and every match offset, so hand it the bytes and decode once
+        return regex.sub(b'', text.encode('utf-8')).decode('utf-8')
+
+    def remove_lines(self, text):
+        """Return text without the lines matching any pattern (and without the rest from a stop pattern line on)"""
+        if self.database is not None:
+            return self.remove_lines_with_hyperscan(text)
+        if self.keywords is not None and next(self.keywords.iter(fold_case(text)), None) is None:
+            # No keyword anywhere, only the patterns without one can match
+            return self.remove_matches(self.residual_regex, text) if self.residual_regex else text
+        return self.remove_matches(self.regex, text)
+
+
+# Language-specific cleanup patterns
+CLEANUP_PATTERNS = {
+    'french': {
+        'subscription_walls': [
+            r'Il vous reste \d+[.,]\d*% de cet article à lire.*',
+            r'La suite est réservée aux abonnés.*',
+            r'Article réservé à nos abonnés.*',
+            r'Pour lire la suite.*abonnez-vous.*',
+            r'Cet article est réservé aux abonnés.*',
+            r'Le contenu auquel vous tentez d\'accéder.*abonné.*',
+            r'\*\*Il vous reste \d+.*à lire\*\*',
+            r'Accès illimité.*à partir de.*€.*'
+        ],
+        
+        'navigation_elements': [
+            r'Lire aussi.*?\|.*?Article réservé.*',
+            r'Lire aussi la tribune.*?\|.*',
+            r'Lire plus tard.*',
+            r'Lire la suite.*',
+            r'Voir aussi.*?\|.*',
+            r'À lire également.*',
+            r'Dans le même dossier.*',
+            r'Sur le même sujet.*'
+        ],
+        
+        'social_sharing': [
+            r'Partager cet article.*',
+            r'Partager sur Facebook.*',
+            r'Partager sur Twitter.*',
+            r'Suivez.*?sur.*',
+            r'Retrouvez.*?sur.*',
+            r'Rejoignez.*?sur.*'
+        ],
+        
+        'newsletter_promotional': [
+            r'Recevez.*?newsletter.*',
+            r'S\'abonner.*?à partir de.*€.*',
+            r'Abonnez-vous.*',
+            r'Newsletter.*gratuite.*',
+            r'Inscrivez-vous.*newsletter.*',
+            r'Découvrez nos offres.*abonnement.*'
+        ],
+        
+        'footer_elements': [
+            r'Le Monde.*Tous droits réservés.*',
+            r'Copyright.*Le Monde.*',
+            r'Mentions légales.*',
+            r'Politique de confidentialité.*',
+            r'Conditions générales.*',
+            r'CGU.*CGV.*'
+        ],
+        
+        'editorial_notes': [
+            r'\(.*?Mis à jour.*?\)',
+            r'\(.*?Publié.*?\)',
+            r'\(.*?Modifié.*?\)',
+            r'^Par\s+[A-Z][a-z]+\s+[A-Z][a-z]+.*$',  # Author bylines at start of line
+            r'Édité par.*',
+            r'Relu par.*'
+        ]
+    },
+    
+    'romanian': {
+        'subscription_walls': [
+            r'Restul articolului este rezervat abonațiilor.*',
+            r'Pentru a citi restul articolului.*abonează-te.*',
+            r'Articol disponibil doar pentru abonați.*',
+            r'Conținutul complet.*doar pentru abonați.*',
+            r'Acest articol este disponibil doar.*',
+            r'Pentru a accesa conținutul complet.*',
+            r'\*\*Îți mai rămân \d+.*de citit\*\*',
+            r'Abonament de la.*lei.*'
+        ],
+        
+        'navigation_elements': [
+            r'Citește și:.*',
+            r'Vezi și:.*',
+            r'Citește mai mult.*',
+            r'Continuă citirea.*',
+            r'În același subiect.*',
+            r'Articole similare.*',
+            r'Pe același subiect.*',
+            r'De asemenea:.*'
+        ],
+        
+        'social_sharing': [
+            r'Distribuie acest articol.*',
+            r'Distribuie pe Facebook.*',
+            r'Distribuie pe Twitter.*',
+            r'Urmărește.*?pe.*',
+            r'Găsește.*?pe.*',
+            r'Alătură-te.*?pe.*'
+        ],
+        
+        'newsletter_promotional': [
+            r'Primește newsletter.*',
+            r'Abonează-te.*newsletter.*',
+            r'Înscrie-te.*newsletter.*',
+            r'Newsletter.*gratuit.*',
+            r'Află primul.*newsletter.*',
+            r'Descoperă ofertele.*abonament.*'
+        ],
+        
+        'footer_elements': [
+            r'Toate drepturile rezervate.*',
+            r'Copyright.*',
+            r'Termeni și condiții.*',
+            r'Politica de confidențialitate.*',
+            r'Contact.*redacție.*',
+            r'Despre noi.*'
+        ],
+        
+        'editorial_notes': [
+            r'\(.*?Actualizat.*?\)',
+            r'\(.*?Publicat.*?\)',
+            r'\(.*?Modificat.*?\)',
+            r'^De\s+[A-Z][a-z]+\s+[A-Z][a-z]+.*$',  # Author bylines only at start of line
+            r'Editor:.*',
+            r'Autor:.*'
+        ]
+    },
+    
+    'english': {
+        'subscription_walls': [
+            r'You have \d+% of this article remaining.*',
+            r'This content is for subscribers only.*',
+            r'Subscribe to continue reading.*',
+            r'To read the full article.*subscribe.*',
+            r'Premium content.*subscribers only.*',
+            r'\*\*You have \d+.*remaining\*\*',
+            r'Subscription from.*\$.*month.*'
+        ],
+        
+        'navigation_elements': [
+            r'Read also:.*',
+            r'See also:.*',
+            r'Read more.*',
+            r'Continue reading.*',
+            r'Related articles.*',
+            r'On the same topic.*',
+            r'You might also like.*'
+        ],
+        
+        'social_sharing': [
+            r'Share this article.*',
+            r'Share on Facebook.*',
+            r'Share on Twitter.*',
+            r'Follow.*?on.*',
+            r'Find.*?on.*',
+            r'Join.*?on.*'
+        ],
+        
+        'newsletter_promotional': [
+            r'Get our newsletter.*',
+            r'Subscribe.*newsletter.*',
+            r'Sign up.*newsletter.*',
+            r'Free newsletter.*',
+            r'Be the first.*newsletter.*',
+            r'Discover.*subscription.*'
+        ]
+    }
+}
+
+# Universal patterns that work across languages
+UNIVERSAL_PATTERNS = {
+    'social_media': [
+        r'^@[a-zA-Z0-9_]+$',         # Social handles only on their own line
+        r'(?:^|\s)#[a-zA-Z][a-zA-Z0-9_]*(?:\s|$)',  # Hashtags that start with letters (not numbers)
+        r'bit\.ly/[a-zA-Z0-9]+',     # Short URLs
+        r'tinyurl\.com/[a-zA-Z0-9]+' # Short URLs
+    ],
+    
+    'urls_and_links': [
+        r'https?://[^\s]+',          # Full URLs
+        r'www\.[^\s]+',              # www links
+        r'\[.*?\]\(.*?\)',           # Markdown links
+        r'<a\s+[^>]*>.*?</a>'        # HTML links (if any remain)
+    ],
+    
+    'percentage_indicators': [
+        r'^\d+[.,]\d*%.*',           # Lines starting with percentages
+        r'\d+[.,]\d*%.*r[ae]maining' # Content remaining indicators (and common typo)
+    ],
+    
+    'subscription_indicators': [
+        r'paywall',
+        r'premium.*content',
+        r'subscriber.*only',
+        r'subscription.*required'
+    ],
+    
+    'navigation_breadcrumbs': [
+        r'^[A-Z][a-z]+\s*[|\>]\s*[A-Z][a-z]+.*',  # "News | Politics"
+        r'^Home\s*[|\>].*',                        # "Home > News > Article"
+        r'[|\>]\s*Article$'                        # "... > Article"
+    ],
+    
+    'advertisement_markers': [
+        r'Advertisement',
+        r'Sponsored Content',
+        r'Promoted Post',
+        r'Publicité',
+        r'Reclamă',
+        r'Anunț comercial'
+    ]
+}
+
+
+@lru_cache(maxsize=None)
+def build_cleanup_filters():
+    """Compile the cleanup pattern tables once per process, shared by every cleaner instance"""
+    # Fuse each pattern group into a single regex that runs over the whole
+    # text at once instead of once per pattern per line
+    universal = [p for category_patterns in UNIVERSAL_PATTERNS.values() for p in category_patterns]
+    universal_filter = LineFilter(universal)
+    paywall_filters = {}
+    skip_filters = {}
+    for language, categories in CLEANUP_PATTERNS.items():
+        skip = [p for category, category_patterns in categories.items()
+                if category != 'subscription_walls' for p in category_patterns]
+        skip_filters[language] = LineFilter(skip + universal)
+        # Same lines removed, plus a cut at the first paywall line, in one scan
+        paywall_filters[language] = LineFilter(skip + universal, categories.get('subscription_walls', []))
+    return universal_filter, paywall_filters, skip_filters
+
 
 class MultiLanguageTextCleaner:
     def __init__(self):
-        self.cleanup_patterns = {
-            'french': {
-                'subscription_walls': [
-                    r'Il vous reste \d+[.,]\d*% de cet article à lire.*',
-                    r'La suite est réservée aux abonnés.*',
-                    r'Article réservé à nos abonnés.*',
-                    r'Pour lire la suite.*abonnez-vous.*',
-                    r'Cet article est réservé aux abonnés.*',
-                    r'Le contenu auquel vous tentez d\'accéder.*abonné.*',
-                    r'\*\*Il vous reste \d+.*à lire\*\*',
-                    r'Accès illimité.*à partir de.*€.*'
-                ],
-                
-                'navigation_elements': [
-                    r'Lire aussi.*?\|.*?Article réservé.*',
-                    r'Lire aussi la tribune.*?\|.*',
-                    r'Lire plus tard.*',
-                    r'Lire la suite.*',
-                    r'Voir aussi.*?\|.*',
-                    r'À lire également.*',
-                    r'Dans le même dossier.*',
-                    r'Sur le même sujet.*'
-                ],
-                
-                'social_sharing': [
-                    r'Partager cet article.*',
-                    r'Partager sur Facebook.*',
-                    r'Partager sur Twitter.*',
-                    r'Suivez.*?sur.*',
-                    r'Retrouvez.*?sur.*',
-                    r'Rejoignez.*?sur.*'
-                ],
-                
-                'newsletter_promotional': [
-                    r'Recevez.*?newsletter.*',
-                    r'S\'abonner.*?à partir de.*€.*',
-                    r'Abonnez-vous.*',
-                    r'Newsletter.*gratuite.*',
-                    r'Inscrivez-vous.*newsletter.*',
-                    r'Découvrez nos offres.*abonnement.*'
-                ],
-                
-                'footer_elements': [
-                    r'Le Monde.*Tous droits réservés.*',
-                    r'Copyright.*Le Monde.*',
-                    r'Mentions légales.*',
-                    r'Politique de confidentialité.*',
-                    r'Conditions générales.*',
-                    r'CGU.*CGV.*'
-                ],
-                
-                'editorial_notes': [
-                    r'\(.*?Mis à jour.*?\)',
-                    r'\(.*?Publié.*?\)',
-                    r'\(.*?Modifié.*?\)',
-                    r'^Par\s+[A-Z][a-z]+\s+[A-Z][a-z]+.*$',  # Author bylines at start of line
-                    r'Édité par.*',
-                    r'Relu par.*'
-                ]
-            },
-            
-            'romanian': {
-                'subscription_walls': [
-                    r'Restul articolului este rezervat abonațiilor.*',
-                    r'Pentru a citi restul articolului.*abonează-te.*',
-                    r'Articol disponibil doar pentru abonați.*',
-                    r'Conținutul complet.*doar pentru abonați.*',
-                    r'Acest articol este disponibil doar.*',
-                    r'Pentru a accesa conținutul complet.*',
-                    r'\*\*Îți mai rămân \d+.*de citit\*\*',
-                    r'Abonament de la.*lei.*'
-                ],
-                
-                'navigation_elements': [
-                    r'Citește și:.*',
-                    r'Vezi și:.*',
-                    r'Citește mai mult.*',
-                    r'Continuă citirea.*',
-                    r'În același subiect.*',
-                    r'Articole similare.*',
-                    r'Pe același subiect.*',
-                    r'De asemenea:.*'
-                ],
-                
-                'social_sharing': [
-                    r'Distribuie acest articol.*',
-                    r'Distribuie pe Facebook.*',
-                    r'Distribuie pe Twitter.*',
-                    r'Urmărește.*?pe.*',
-                    r'Găsește.*?pe.*',
-                    r'Alătură-te.*?pe.*'
-                ],
-                
-                'newsletter_promotional': [
-                    r'Primește newsletter.*',
-                    r'Abonează-te.*newsletter.*',
-                    r'Înscrie-te.*newsletter.*',
-                    r'Newsletter.*gratuit.*',
-                    r'Află primul.*newsletter.*',
-                    r'Descoperă ofertele.*abonament.*'
-                ],
-                
-                'footer_elements': [
-                    r'Toate drepturile rezervate.*',
-                    r'Copyright.*',
-                    r'Termeni și condiții.*',
-                    r'Politica de confidențialitate.*',
-                    r'Contact.*redacție.*',
-                    r'Despre noi.*'
-                ],
-                
-                'editorial_notes': [
-                    r'\(.*?Actualizat.*?\)',
-                    r'\(.*?Publicat.*?\)',
-                    r'\(.*?Modificat.*?\)',
-                    r'^De\s+[A-Z][a-z]+\s+[A-Z][a-z]+.*$',  # Author bylines only at start of line
-                    r'Editor:.*',
-                    r'Autor:.*'
-                ]
-            },
-            
-            'english': {
-                'subscription_walls': [
-                    r'You have \d+% of this article remaining.*',
-                    r'This content is for subscribers only.*',
-                    r'Subscribe to continue reading.*',
-                    r'To read the full article.*subscribe.*',
-                    r'Premium content.*subscribers only.*',
-                    r'\*\*You have \d+.*remaining\*\*',
-                    r'Subscription from.*\$.*month.*'
-                ],
-                
-                'navigation_elements': [
-                    r'Read also:.*',
-                    r'See also:.*',
-                    r'Read more.*',
-                    r'Continue reading.*',
-                    r'Related articles.*',
-                    r'On the same topic.*',
-                    r'You might also like.*'
-                ],
-                
-                'social_sharing': [
-                    r'Share this article.*',
-                    r'Share on Facebook.*',
-                    r'Share on Twitter.*',
-                    r'Follow.*?on.*',
-                    r'Find.*?on.*',
-                    r'Join.*?on.*'
-                ],
-                
-                'newsletter_promotional': [
-                    r'Get our newsletter.*',
-                    r'Subscribe.*newsletter.*',
-                    r'Sign up.*newsletter.*',
-                    r'Free newsletter.*',
-                    r'Be the first.*newsletter.*',
-                    r'Discover.*subscription.*'
-                ]
-            }
-        }
-        
-        # Universal patterns that work across languages
-        self.universal_patterns = {
-            'social_media': [
-                r'^@[a-zA-Z0-9_]+$',         # Social handles only on their own line
-                r'(?:^|\s)#[a-zA-Z][a-zA-Z0-9_]*(?:\s|$)',  # Hashtags that start with letters (not numbers)
-                r'bit\.ly/[a-zA-Z0-9]+',     # Short URLs
-                r'tinyurl\.com/[a-zA-Z0-9]+' # Short URLs
-            ],
-            
-            'urls_and_links': [
-                r'https?://[^\s]+',          # Full URLs
-                r'www\.[^\s]+',              # www links
-                r'\[.*?\]\(.*?\)',           # Markdown links
-                r'<a\s+[^>]*>.*?</a>'        # HTML links (if any remain)
-            ],
-            
-            'percentage_indicators': [
-                r'^\d+[.,]\d*%.*',           # Lines starting with percentages
-                r'.*\d+[.,]\d*%.*remaining.*', # Content remaining indicators
-                r'.*\d+[.,]\d*%.*ramaining.*'  # Common typo
-            ],
-            
-            'subscription_indicators': [
-                r'.*paywall.*',
-                r'.*premium.*content.*',
-                r'.*subscriber.*only.*',
-                r'.*subscription.*required.*'
-            ],
-            
-            'navigation_breadcrumbs': [
-                r'^[A-Z][a-z]+\s*[|\>]\s*[A-Z][a-z]+.*',  # "News | Politics"
-                r'^Home\s*[|\>].*',                        # "Home > News > Article"
-                r'.*\s*[|\>]\s*Article$'                   # "... > Article"
-            ],
-            
-            'advertisement_markers': [
-                r'Advertisement',
-                r'Sponsored Content',
-                r'Promoted Post',
-                r'Publicité',
-                r'Reclamă',
-                r'Anunț comercial'
-            ]
-        }
+        self.cleanup_patterns = CLEANUP_PATTERNS
+        self.universal_patterns = UNIVERSAL_PATTERNS
+        self.universal_filter, self.paywall_filters, self.skip_filters = build_cleanup_filters()
 
     def detect_language(self, text, domain=""):
         """Detect language from text and domain"""
@@ -226,15 +588,16 @@ class MultiLanguageTextCleaner:
         elif domain.endswith(('.com', '.org', '.net', '.uk', '.us')):
             return 'english'
         
-        # Simple language detection based on common words
-        text_lower = text.lower()
+        # Simple language detection based on common words, looked up in the
+        # words of the beginning of the text
+        words = set(WORD.findall(text[:LANGUAGE_SAMPLE_SIZE].lower()))
         
         # Romanian indicators
-        if any(word in text_lower for word in ['și', 'cu', 'pentru', 'este', 'sunt', 'într-un', 'într-o']):
+        if words & ROMANIAN_MARKERS:
             return 'romanian'
         
         # French indicators
-        if any(word in text_lower for word in ['avec', 'pour', 'dans', 'cette', 'vous', 'nous', 'être']):
+        if words & FRENCH_MARKERS:
             return 'french'
         
         # Default to English
@@ -245,95 +608,39 @@ class MultiLanguageTextCleaner:
         if language is None:
             language = self.detect_language(text, domain)
         
-        original_text = text
-        lines = text.split('\n')
-        cleaned_lines = []
-        
         # Get patterns for detected language
-        patterns = self.cleanup_patterns.get(language, {})
-        
-        paywall_hit = False
+        line_filters = self.paywall_filters if stop_at_paywall else self.skip_filters
+        line_filter = line_filters.get(language, self.universal_filter)
         
-        for line in lines:
-            stripped_line = line.strip()
-            
-            # Preserve empty lines for paragraph breaks
-            if not stripped_line:
-                cleaned_lines.append('')
-                continue
-            
-            # Check for paywall/subscription wall
-            if stop_at_paywall and not paywall_hit:
-                paywall_patterns = patterns.get('subscription_walls', [])
-                for pattern in paywall_patterns:
-                    if re.search(pattern, stripped_line, re.IGNORECASE):
-                        paywall_hit = True
-                        # Paywall detected (verbose output removed)
-                        break
-                
-                if paywall_hit:
-                    break
-            
-            # Skip lines matching cleanup patterns
-            should_skip = False
-            
-            # Check language-specific patterns
-            for category, category_patterns in patterns.items():
-                if category == 'subscription_walls':  # Already handled above
-                    continue
-                    
-                for pattern in category_patterns:
-                    if re.search(pattern, stripped_line, re.IGNORECASE):
-                        should_skip = True
-                        break
-                if should_skip:
-                    break
-            
-            # Check universal patterns
-            if not should_skip:
-                for category, category_patterns in self.universal_patterns.items():
-                    for pattern in category_patterns:
-                        if re.search(pattern, stripped_line, re.IGNORECASE):
-                            should_skip = True
-                            break
-                    if should_skip:
-                        break
-            
-            # Keep line if it passes all filters
-            if not should_skip:
-                cleaned_lines.append(stripped_line)
+        # Trim every line, keeping empty lines for paragraph breaks
+        text = LINE_EDGE_WHITESPACE.sub('', text)
         
-        # Join cleaned lines
-        cleaned_text = '\n'.join(cleaned_lines)
+        # Remove lines matching cleanup patterns, and everything from the first
+        # paywall/subscription wall line onwards
+        cleaned_text = line_filter.remove_lines(text)
         
         # Additional post-processing
         cleaned_text = self.post_process_text(cleaned_text)
         
-        # Stats
-        original_lines = len([l for l in original_text.split('\n') if l.strip()])
-        cleaned_lines_count = len([l for l in cleaned_lines if l.strip()])
-        
-        # Optionally log statistics (removed verbose output)
-        # original_lines → cleaned_lines_count lines ({language})
+        # Only count lines when someone is listening
+        if logger.isEnabledFor(logging.DEBUG):
+            original_lines = len([l for l in text.split('\n') if l])
+            cleaned_lines_count = len([l for l in cleaned_text.split('\n') if l])
+            logger.debug("Text cleaning: %d → %d lines (%s)", original_lines, cleaned_lines_count, language)
         
         return cleaned_text
 
     def post_process_text(self, text):
         """Final text cleaning and normalization"""
         # Remove excessive whitespace
-        text = re.sub(r'\n{3,}', '\n\n', text)  # Max 2 consecutive newlines
-        text = re.sub(r'[ \t]+', ' ', text)     # Normalize spaces
-        text = re.sub(r' +\n', '\n', text)      # Remove trailing spaces
+        text = MULTIPLE_NEWLINES.sub('\n\n', text)  # Max 2 consecutive newlines
+        text = SPACES_AND_TABS.sub(' ', text)       # Normalize spaces
+        text = LINE_EDGE_WHITESPACE.sub('', text)   # Trim lines, trailing spaces included
         
-        # Remove very short lines (likely artifacts)
-        lines = text.split('\n')
-        filtered_lines = []
-        for line in lines:
-            line = line.strip()
-            if len(line) > 3 or line == '':  # Keep empty lines for paragraph breaks
-                filtered_lines.append(line)
+        # Remove very short lines (likely artifacts), keeping empty lines for paragraph breaks
+        text = SHORT_LINES.sub('', text)
         
-        return '\n'.join(filtered_lines).strip()
+        return text.strip()
 
     def get_cleanup_stats(self, original_text, cleaned_text):
         """Generate statistics about text cleaning"""
@@ -352,7 +659,8 @@ class MultiLanguageTextCleaner:
             'reduction_percentage': ((original_words - cleaned_words) / original_words * 100) if original_words > 0 else 0
         }
 
-    def load_domain_cleanup_rules(self, domain):
+    @staticmethod
+    def load_domain_cleanup_rules(domain):
         """Load domain-specific cleanup rules from config file"""
         config_file = os.path.join("extraction_rules", f"{domain}.yaml")
         if os.path.exists(config_file):
@@ -361,23 +669,42 @@ class MultiLanguageTextCleaner:
                     config = yaml.safe_load(f)
                     return config.get('cleanup_patterns', {})
             except Exception as e:
-                print(f"Warning: Could not load cleanup rules for {domain}: {e}")
+                logger.warning("Could not load cleanup rules for %s: %s", domain, e)
         return {}
 
     def clean_with_domain_rules(self, text, domain):
         """Clean text using domain-specific rules"""
-        domain_rules = self.load_domain_cleanup_rules(domain)
-        if not domain_rules:
-            return self.clean_text(text, domain=domain)
-        
         # Apply domain-specific patterns first
-        for category, patterns in domain_rules.items():
-            for pattern in patterns:
-                text = re.sub(pattern, '', text, flags=re.MULTILINE | re.IGNORECASE)
+        for regex in load_compiled_domain_rules(domain):
+            text = regex.sub('', text)
         
         # Then apply universal cleaning
         return self.clean_text(text, domain=domain)
 
+    def clean_batch(self, items, workers=None):
+        """Clean (text, domain) pairs with domain rules across worker processes, results in input order"""
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_batch_worker) as executor:
+            return list(executor.map(clean_batch_item, items, chunksize=BATCH_CHUNK_SIZE))
+
+
+# Articles handed to a worker process at a time by clean_batch
+BATCH_CHUNK_SIZE = 32
+
+# Cleaner of the current batch worker process
+batch_cleaner = None
+
+
+def init_batch_worker():
+    """Build the worker's cleaner, compiling the patterns in the worker rather than pickling them"""
+    global batch_cleaner
+    batch_cleaner = MultiLanguageTextCleaner()
+
+
+def clean_batch_item(item):
+    """Clean one (text, domain) pair in a batch worker process"""
+    text, domain = item
+    return batch_cleaner.clean_with_domain_rules(text, domain)
+
 
 if __name__ == "__main__":
     # Test the text cleaning system
@@ -5,38 +5,400 @@ Extracts clean article text from HTML files using generic and website-specific r
 """
 
 import os
+import re
+import sys
 import json
+import html
+import hashlib
+import multiprocessing
 import yaml
+import unicodedata
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urlparse, urlsplit
+from concurrent.futures import ProcessPoolExecutor
+from bs4 import BeautifulSoup, Comment, SoupStrainer
+import soupsieve
 
 # Configuration
-import trafilatura
-from newspaper import Article
 from text_cleanup import MultiLanguageTextCleaner
 import time
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    from resiliparse.extract.html2text import extract_plain_text
+    from resiliparse.parse.html import HTMLTree
+    RESILIPARSE_AVAILABLE = True
+except ImportError:
+    RESILIPARSE_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Resiliparse is the fastest extractor, trafilatura the default when it is not installed
+DEFAULT_EXTRACTION_METHOD = 'resiliparse' if RESILIPARSE_AVAILABLE else 'trafilatura'
+
 CONTENT_DIR = "content"
 LOGS_DIR = "logs"
 STATUS_FILE = "text_extractor_status.json"
+# Status entries written as each file is processed, one JSON line per file, folded into STATUS_FILE at the end of a run
+STATUS_JOURNAL = "text_extractor_status.jsonl"
+# Journaled entries between rewrites of STATUS_FILE during a run, bounds the journal a restart has to replay;
+# with a large status the journal may grow to a tenth of it first, so rewrites stay a small share of the run
+CHECKPOINT_INTERVAL = 64
+CHECKPOINT_STATUS_FRACTION = 10
+
+# Metadata files are written with libyaml's C dumper when PyYAML was built with it
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+# Characters JSON leaves unescaped that YAML rejects or reads as line breaks
+YAML_UNSAFE_CHARACTERS = re.compile('[\x7f-\x9f\u2028\u2029\ud800-\udfff\ufffe\uffff]')
+
+# Output directories written next to each domain's raw/ directory
+OUTPUT_DIRS = ('extracted', 'metadata', 'cleaned')
+
+# Domain mapping for short forms to full forms, for the domain filter
+DOMAIN_MAPPING = {
+    'digi24.ro': 'www.digi24.ro',
+    'bzi.ro': 'www.bzi.ro',
+    'lemonde.fr': 'www.lemonde.fr'
+}
+
+# Non-content elements removed before extraction
+UNWANTED_TAGS = [
+    'script', 'style', 'nav', 'footer', 'aside',
+    'iframe', 'embed', 'object', 'applet', 'form',
+    'button', 'input', 'textarea', 'select', 'option',
+    'noscript', 'meta', 'link', 'title'
+]
+UNWANTED_TAG_SELECTOR = ', '.join(UNWANTED_TAGS)
+
+# Elements with common non-content classes/ids
+UNWANTED_SELECTORS = [
+    '[class*="advertisement"]', '[class*="ad-"]', '[class*="ads"]',
+    '[class*="sidebar"]', '[class*="widget"]', '[class*="menu"]',
+    '[class*="nav"]', '[class*="header"]', '[class*="footer"]',
+    '[class*="social"]', '[class*="share"]', '[class*="comment"]',
+    '[id*="advertisement"]', '[id*="ad-"]', '[id*="ads"]',
+    '[id*="sidebar"]', '[id*="widget"]', '[id*="menu"]',
+    '[id*="nav"]', '[id*="header"]', '[id*="footer"]'
+]
+UNWANTED_SELECTOR = ', '.join(UNWANTED_SELECTORS)
+UNWANTED_SELECTOR_MATCHER = soupsieve.compile(UNWANTED_SELECTOR)
+
+# More conservative lists for the light cleaning done before newspaper3k
+LIGHT_UNWANTED_TAGS = [
+    'script', 'style', 'nav', 'footer', 'aside',
+    'iframe', 'embed', 'object', 'applet',
+    'noscript', 'meta', 'link', 'title'
+]
+LIGHT_UNWANTED_SELECTOR = ', '.join([
+    '[class*="advertisement"]', '[class*="ads"]',
+    '[id*="advertisement"]', '[id*="ads"]'
+])
+LIGHT_UNWANTED_SELECTOR_MATCHER = soupsieve.compile(LIGHT_UNWANTED_SELECTOR)
+
+# Attributes kept on the remaining elements
+KEPT_ATTRIBUTES = frozenset(['href', 'src', 'alt', 'title'])
+
+# Inline and block formatting converted to Markdown markers before extraction
+FORMATTING_TAGS = ['b', 'strong', 'i', 'em', 'u', 'code', 'tt', 'blockquote']
+
+# Header detection only needs the h1-h6 subtrees built into a tree
+HEADER_STRAINER = SoupStrainer(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+# Whitespace cleanup applied to cleaned HTML
+BLANK_LINE_RUNS = re.compile(r'\n\s*\n\s*\n+')
+WHITESPACE_BETWEEN_TAGS = re.compile(r'>\s{3,}<')
+# Indentation after a line break; with a literal newline to anchor on this is much
+# faster than a MULTILINE ^ pattern, which tries a match at every position
+INDENTED_LINE_START = re.compile(r'\n[ \t]+')
+
+# Newlines followed by content, doubled into paragraph breaks for trafilatura output
+LINE_BREAK_BEFORE_CONTENT = re.compile(r'\n(?=\S)')
+
+# ISO date at the start of a published time meta tag
+ISO_DATE_PREFIX = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Charset declared by a meta tag, looked for in the first bytes of pages that are not valid UTF-8
+META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([A-Za-z0-9_:.-]+)', re.IGNORECASE)
+META_CHARSET_SCAN_BYTES = 8192
+
+# Spaces inside Markdown markers produced from HTML formatting tags
+MARKDOWN_MARKER_SPACING = [
+    (re.compile(r'\*\*\s+'), '**'),
+    (re.compile(r'\s+\*\*'), '**'),
+    (re.compile(r'(?<!\*)\*\s+'), '*'),
+    (re.compile(r'\s+\*(?!\*)'), '*'),
+    (re.compile(r'`\s+'), '`'),
+    (re.compile(r'\s+`'), '`'),
+]
+
+# Markdown formatting fixes for extracted text, applied in order
+# (pattern, replacement, marker): a rule with a marker character can only match text
+# that contains it, and none of the rules adds a marker the text did not have before
+MARKDOWN_CLEANUP_RULES = [
+    # Fix broken bold formatting ONLY when it's clearly broken across lines within a sentence
+    # Don't remove newlines that separate paragraphs or sections
+    # Only fix if there's text immediately before and after the break (indicating broken formatting)
+    # Use [ \t] to match only spaces and tabs, not newlines
+    (re.compile(r'(\w)\*\*[ \t]*\n[ \t]*(\w)'), r'\1**\2', '*'),  # Fix broken bold within text
+    (re.compile(r'(\w)[ \t]*\n[ \t]*\*\*(\w)'), r'\1**\2', '*'),  # Fix broken bold within text
+    
+    # Fix broken italic formatting (same logic)
+    (re.compile(r'(\w)\*[ \t]*\n[ \t]*(\w)'), r'\1*\2', '*'),
+    (re.compile(r'(\w)[ \t]*\n[ \t]*\*(?!\*)(\w)'), r'\1*\2', '*'),
+    
+    # Fix broken code formatting (same logic)
+    (re.compile(r'(\w)`[ \t]*\n[ \t]*(\w)'), r'\1`\2', '`'),
+    (re.compile(r'(\w)[ \t]*\n[ \t]*`(\w)'), r'\1`\2', '`'),
+    
+    # Remove empty bold/italic tags - FIXED: be more specific to avoid matching valid bold formatting
+    (re.compile(r'\*\*\s*\*\*'), '', '*'),  # Remove empty bold tags like ** **
+    # FIXED: Only match single * followed by whitespace and another single * (true empty italic tags)
+    # This avoids matching ** (bold markers)
+    (re.compile(r'(?<!\*)\*\s+\*(?!\*)'), '', '*'),  # Remove empty italic tags like * * but not **
+    (re.compile(r'``'), '', '`'),  # Remove empty code tags
+    
+    # Fix multiple consecutive formatting markers
+    (re.compile(r'\*{3,}'), '**', '*'),
+    
+    # Ensure proper spacing around formatting - but don't break existing good formatting
+    # Only add space before bold if there's no space already
+    (re.compile(r'(\w)(\*\*\w)'), r'\1 \2', '*'),  # Add space before bold if missing
+    # Only add space before italic if there's no space already and it's not part of bold
+    (re.compile(r'(\w)(\*(?!\*)\w)'), r'\1 \2', '*'),  # Add space before italic if missing
+    
+    # Clean up excessive whitespace but preserve paragraph breaks
+    # Replace multiple spaces (but not newlines) with single space
+    (re.compile(r'[ \t]{2,}'), ' ', None),
+    # Replace more than 2 consecutive newlines with exactly 2 (paragraph break)
+    (re.compile(r'\n{3,}'), '\n\n', None),
+    # Remove trailing spaces from lines
+    (re.compile(r'[ \t]+\n'), '\n', None),
+]
+
+# Article slugs in URL paths, used when the HTML has no title
+LEMONDE_URL_SLUG = re.compile(r'/([^/]+)_\d+_\d+\.html$')
+BZI_URL_SLUG = re.compile(r'/([^/]+)-\d+$')
+DIGI24_URL_SLUG = re.compile(r'/([^/]+)-(\d+)$')
+# Slug pattern and title language per domain
+URL_TITLE_RULES = {
+    # Le Monde: /article-slug_ARTICLEID_CATEGORYID.html
+    # Example: katrina-l-ouragan-infernal-sur-netflix-vingt-ans-apres-spike-lee-prend-le-pouls-de-la-nouvelle-orleans
+    'www.lemonde.fr': (LEMONDE_URL_SLUG, 'fr'),
+    # BZI.ro and Digi24.ro: /article-slug-ARTICLEID
+    'www.bzi.ro': (BZI_URL_SLUG, 'ro'),
+    'www.digi24.ro': (DIGI24_URL_SLUG, 'ro')
+}
+# Per language: articles and prepositions kept lowercase in slug titles, and the length up to
+# which other words stay lowercase too (longer words are likely proper nouns or important words)
+SLUG_TITLE_RULES = {
+    'fr': (frozenset(['le', 'la', 'les', 'de', 'du', 'des', 'à', 'au', 'aux', 'et', 'ou', 'pour', 'sur', 'avec', 'sans', 'dans', 'par', 'un', 'une']), 3),
+    'ro': (frozenset(['de', 'la', 'în', 'cu', 'pe', 'din', 'pentru', 'prin', 'după', 'înainte', 'fără', 'și', 'sau', 'dar', 'iar', 'un', 'o']), 3),
+    'en': (frozenset(['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by']), 0)
+}
+
+# Line starts that rule out a paragraph break or a heuristic header
+NON_PARAGRAPH_PREFIXES = ('#', '>', '-', '*', '1.', '2.', '3.')
+# Line ends that close a sentence, for paragraph breaks
+SENTENCE_ENDINGS = ('.', '!', '?', '"')
+CONTINUATION_WORDS = ('și ', 'dar ', 'iar ', 'sau ', 'însă ', 'pentru că ', 'deoarece ')
+NON_HEADER_PREFIXES = ('În ', 'De ', 'Cu ', 'Pentru ', 'Prin ', 'Astfel', 'Așa', 'Dar', 'Și')
+# Line starts that mark the line after a heuristic header as content
+CONTENT_START_WORDS = ('În ', 'De ', 'Cu ', 'Pentru ', 'Prin ', 'Acest', 'Potrivit', 'După')
+# Line ends that rule out a heuristic header, ? is allowed for question headers
+NON_HEADER_ENDINGS = ('.', '!', ':', ';', ',')
+# Line ends that mark the line after a heuristic header as content
+CONTENT_ENDINGS = ('.', '!', '?', ':', ';')
+
+def dump_json(data):
+    """Serialize to compact UTF-8 JSON bytes, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def load_json(data):
+    """Parse JSON bytes or text, with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=256)
+def load_extraction_rules(domain):
+    """Load a domain's extraction rules once per process; callers must not modify the returned dict"""
+    config_file = os.path.join("extraction_rules", f"{domain}.yaml")
+    if os.path.exists(config_file):
+        try:
+            with open(config_file, 'r', encoding='utf-8') as f:
+                return yaml.load(f, Loader=YAML_LOADER) or {}
+        except Exception as e:
+            print(f"Warning: Could not load extraction rules for {domain}: {e}")
+    return {}
+
+
+@lru_cache(maxsize=256)
+def load_custom_sections(domain):
+    """
+    Enabled custom content sections of a domain, sorted by their order field, and the processing options
+    Returns an empty tuple of sections when the domain has none
+    """
+    custom_sections = load_extraction_rules(domain).get('custom_content_sections', {})
+    if not custom_sections.get('enabled', False):
+        return (), {}
+    sections = tuple(sorted(custom_sections.get('sections', []), key=lambda x: x.get('order', 999)))
+    return sections, custom_sections.get('processing_options', {})
+
+
+@lru_cache(maxsize=None)
+def compile_pattern(pattern):
+    """Compile a regex from the extraction rules once per process"""
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=None)
+def compile_selector(selector):
+    """Compile a CSS selector from the extraction rules once per process"""
+    return soupsieve.compile(selector)
+
+
+@lru_cache(maxsize=None)
+def javascript_variable_patterns(variable):
+    """Regexes for the declarations of a JavaScript variable up to the opening brace: var x = {, window.x = { and x = {"""
+    return tuple(re.compile(pattern) for pattern in (
+        rf'var\s+{variable}\s*=\s*\{{',
+        rf'window\.{variable}\s*=\s*\{{',
+        rf'{variable}\s*=\s*\{{'
+    ))
+
+
+def dump_metadata_yaml(metadata):
+    """
+    Serialize flat metadata to block YAML bytes, keys sorted like yaml.dump
+    Strings are written JSON-quoted, which YAML reads as double-quoted scalars; anything else goes through yaml.dump
+    """
+    lines = []
+    for key in sorted(metadata):
+        value = metadata[key]
+        if isinstance(value, bool):
+            lines.append(f"{key}: {'true' if value else 'false'}\n")
+        elif isinstance(value, int):
+            lines.append(f"{key}: {value}\n")
+        elif isinstance(value, str) and not YAML_UNSAFE_CHARACTERS.search(value):
+            lines.append(f"{key}: {json.dumps(value, ensure_ascii=False)}\n")
+        else:
+            return yaml.dump(metadata, Dumper=YAML_DUMPER, default_flow_style=False, allow_unicode=True, encoding='utf-8')
+    return ''.join(lines).encode('utf-8')
+
+
+def decode_html(html_bytes):
+    """Decode HTML bytes as UTF-8, or with the charset its meta tag declares when they are not valid UTF-8"""
+    try:
+        return html_bytes.decode('utf-8')
+    except UnicodeDecodeError:
+        pass
+    
+    # Older Romanian and French pages are often windows-1250/iso-8859-2 or windows-1252
+    match = META_CHARSET.search(html_bytes, 0, META_CHARSET_SCAN_BYTES)
+    if match:
+        try:
+            return html_bytes.decode(match.group(1).decode('ascii'), errors='ignore')
+        except LookupError:
+            pass  # Unknown charset name
+    return html_bytes.decode('utf-8', errors='ignore')
+
+
+def write_atomically(path, data):
+    """Write bytes to a temporary file and rename it over path, so readers never see a half-written file"""
+    temp_file = f"{path}.tmp"
+    with open(temp_file, 'wb') as f:
+        f.write(data)
+    os.replace(temp_file, path)
+
+
+class NewspaperMetadata:
+    """Title, author and date of a parsed newspaper3k Article, with the attributes of trafilatura's metadata"""
+    __slots__ = ('title', 'author', 'date', 'url')
+    
+    def __init__(self, article, original_url):
+        self.title = article.title
+        self.author = ', '.join(article.authors) if article.authors else None
+        self.date = article.publish_date.strftime('%Y-%m-%d') if article.publish_date else None
+        self.url = original_url
+
+
+class ResiliparseMetadata:
+    """Title, author and date read from a Resiliparse HTMLTree, with the attributes of trafilatura's metadata"""
+    __slots__ = ('title', 'author', 'date', 'url')
+    
+    def __init__(self, tree, original_url):
+        document = tree.document
+        
+        # Title like trafilatura picks it: a single h1, the title element, the first h1 or h2
+        h1_elements = document.query_selector_all('h1')
+        h2_element = document.query_selector('h2')
+        title = ' '.join(h1_elements[0].text.split()) if len(h1_elements) == 1 else ''
+        if not title:
+            title = tree.title
+        if not title and len(h1_elements):
+            title = ' '.join(h1_elements[0].text.split())
+        if not title and h2_element:
+            title = ' '.join(h2_element.text.split())
+        self.title = title or None
+        
+        author = document.query_selector('meta[name="author"]')
+        author = author.getattr('content') if author else None
+        self.author = author.strip() if author and author.strip() else None
+        
+        published = document.query_selector('meta[property="article:published_time"]')
+        date_match = ISO_DATE_PREFIX.match(published.getattr('content') or '') if published else None
+        self.date = date_match.group() if date_match else None
+        
+        self.url = original_url
+
 
 class TextExtractor:
-    def __init__(self, extraction_method='trafilatura', save_cleaned_html=False, domain_filter=None):
+    def __init__(self, extraction_method=DEFAULT_EXTRACTION_METHOD, save_cleaned_html=False, domain_filter=None, workers=None,
+                 fast_extraction=False, load_processed_status=True):
         """
         Initialize TextExtractor
         
         Args:
-            extraction_method (str): 'trafilatura' (default) or 'newspaper'
+            extraction_method (str): 'resiliparse' (default when installed), 'trafilatura' (default otherwise) or 'newspaper'
             save_cleaned_html (bool): If True, save cleaned HTML next to original files
             domain_filter (str): If provided, only process files from this domain (e.g., 'www.digi24.ro' or 'digi24.ro')
+            workers (int): Number of processes extracting files in parallel (default: one per CPU core, 1 to process in this process)
+            fast_extraction (bool): If True, trafilatura skips its readability/jusText fallbacks (about 2x faster, less text on some pages)
+            load_processed_status (bool): If False, start with an empty status instead of reading the status file and journal
         """
-        if extraction_method not in ['trafilatura', 'newspaper']:
-            raise ValueError("extraction_method must be 'trafilatura' or 'newspaper'")
+        if extraction_method not in ['trafilatura', 'newspaper', 'resiliparse']:
+            raise ValueError("extraction_method must be 'trafilatura', 'newspaper' or 'resiliparse'")
+        if extraction_method == 'resiliparse' and not RESILIPARSE_AVAILABLE:
+            raise ValueError("extraction_method 'resiliparse' requires the resiliparse package")
         
         self.extraction_method = extraction_method
         self.save_cleaned_html = save_cleaned_html
+        self.fast_extraction = fast_extraction
         self.original_domain_filter = domain_filter
         self.domain_filter = self.normalize_domain(domain_filter) if domain_filter else None
+        self.workers = workers or os.cpu_count() or 1
         self.text_cleaner = MultiLanguageTextCleaner()
-        self.processed_status = self.load_status()
+        self.processed_status = self.load_status() if load_processed_status else {}
+        self.files_since_checkpoint = 0
+        self.status_journal = None  # Opened on the first journaled entry, closed at each checkpoint
+        self.created_directories = set()  # Output and log directories already made by this process
+        self.skip_logs = None  # JSON and readable skip log handles of skip_log_month, opened on the first skip
+        self.skip_log_month = None
         self.stats = {
             'total_processed': 0,
             'successful_extractions': 0,
@@ -57,21 +419,14 @@ class TextExtractor:
         """
         if not domain:
             return domain
-            
-        # Domain mapping for short forms to full forms
-        domain_mapping = {
-            'digi24.ro': 'www.digi24.ro',
-            'bzi.ro': 'www.bzi.ro',
-            'lemonde.fr': 'www.lemonde.fr'
-        }
         
         # If it's already a full domain (starts with www.), return as-is
         if domain.startswith('www.'):
             return domain
             
         # If it's a known short form, map to full form
-        if domain in domain_mapping:
-            normalized = domain_mapping[domain]
+        if domain in DOMAIN_MAPPING:
+            normalized = DOMAIN_MAPPING[domain]
             return normalized
             
         # If it's an unknown short form, try adding www.
@@ -82,28 +437,69 @@ class TextExtractor:
         return domain
 
     def load_status(self):
-        """Load processing status from file"""
+        """Load processing status from file, plus the entries journaled by a run that did not finish"""
+        status = {}
         if os.path.exists(STATUS_FILE):
             try:
-                with open(STATUS_FILE, 'r') as f:
-                    return json.load(f)
+                with open(STATUS_FILE, 'rb') as f:
+                    status = load_json(f.read())
             except:
                 pass
-        return {}
+        
+        if os.path.exists(STATUS_JOURNAL):
+            try:
+                with open(STATUS_JOURNAL, 'rb') as f:
+                    for line in f:
+                        try:
+                            file_key, entry = load_json(line)
+                        except ValueError:
+                            continue  # Line cut short when the run was interrupted
+                        status[file_key] = entry
+            except OSError:
+                pass
+        
+        return status
 
     def save_status(self):
-        """Save processing status to file"""
-        with open(STATUS_FILE, 'w') as f:
-            json.dump(self.processed_status, f, indent=2)
+        """Save processing status to file, which then holds everything the journal did"""
+        write_atomically(STATUS_FILE, dump_json(self.processed_status))
+        
+        if self.status_journal:
+            self.status_journal.close()
+            self.status_journal = None
+        if os.path.exists(STATUS_JOURNAL):
+            os.remove(STATUS_JOURNAL)
+        self.files_since_checkpoint = 0
+
+    def journal_status(self, file_key):
+        """Append a file's status entry to the journal so it survives an interrupted run, checkpointing once the journal is big enough"""
+        if file_key not in self.processed_status:
+            return
+        
+        # One append handle until the next checkpoint, flushed per entry so an interrupted run loses none
+        if not self.status_journal:
+            self.status_journal = open(STATUS_JOURNAL, 'ab')
+        self.status_journal.write(dump_json([file_key, self.processed_status[file_key]]) + b'\n')
+        self.status_journal.flush()
+        
+        # Each checkpoint rewrites the whole status, so the entries journaled in between grow with it
+        self.files_since_checkpoint += 1
+        if self.files_since_checkpoint >= max(CHECKPOINT_INTERVAL, len(self.processed_status) // CHECKPOINT_STATUS_FRACTION):
+            self.save_status()
+
+    def make_directory(self, path):
+        """Create a directory like os.makedirs(exist_ok=True), only going to the filesystem the first time per path"""
+        if path not in self.created_directories:
+            os.makedirs(path, exist_ok=True)
+            self.created_directories.add(path)
 
     def log_skip_reason(self, file_path, domain, skip_type, reason, details=None):
         """Log detailed skip reasons to both console and log file"""
         now = datetime.now()
         month_str = now.strftime("%Y-%m")
-        month_dir = os.path.join(LOGS_DIR, month_str)
-        os.makedirs(month_dir, exist_ok=True)
-        
-        skip_log_path = os.path.join(month_dir, "text_extractor_skipped.log")
+        if month_str != self.skip_log_month:
+            self.open_skip_logs(month_str)
+        skip_log, human_log = self.skip_logs
         
         # Create log entry
         log_entry = {
@@ -115,20 +511,45 @@ class TextExtractor:
             'details': details or {}
         }
         
-        # Write to log file
-        with open(skip_log_path, "a", encoding="utf-8") as f:
-            f.write(f"{json.dumps(log_entry, ensure_ascii=False)}\n")
+        # Write to log file, one JSON object per line
+        skip_log.write(dump_json(log_entry) + b'\n')
+        skip_log.flush()
         
         # Also write human-readable version
-        human_log_path = os.path.join(month_dir, "text_extractor_skipped_readable.log")
-        with open(human_log_path, "a", encoding="utf-8") as f:
-            f.write(f"[{now.strftime('%Y-%m-%d %H:%M:%S')}] {skip_type.upper()}: {file_path}\n")
-            f.write(f"  Domain: {domain}\n")
-            f.write(f"  Reason: {reason}\n")
-            if details:
-                for key, value in details.items():
-                    f.write(f"  {key}: {value}\n")
-            f.write("\n")
+        human_entry = [
+            f"[{now.strftime('%Y-%m-%d %H:%M:%S')}] {skip_type.upper()}: {file_path}\n",
+            f"  Domain: {domain}\n",
+            f"  Reason: {reason}\n"
+        ]
+        if details:
+            for key, value in details.items():
+                human_entry.append(f"  {key}: {value}\n")
+        human_entry.append("\n")
+        human_log.write(''.join(human_entry).encode('utf-8'))
+        human_log.flush()
+
+    def open_skip_logs(self, month_str):
+        """
+        Open the month's skip logs for appending, closing the previous month's
+        Each entry is flushed as one write, so the entries of worker processes
+        appending to the same files never interleave
+        """
+        self.close_skip_logs()
+        month_dir = os.path.join(LOGS_DIR, month_str)
+        self.make_directory(month_dir)
+        self.skip_logs = (
+            open(os.path.join(month_dir, "text_extractor_skipped.log"), "ab"),
+            open(os.path.join(month_dir, "text_extractor_skipped_readable.log"), "ab")
+        )
+        self.skip_log_month = month_str
+
+    def close_skip_logs(self):
+        """Close the skip log handles, if any are open"""
+        if self.skip_logs:
+            for f in self.skip_logs:
+                f.close()
+            self.skip_logs = None
+            self.skip_log_month = None
 
     def clean_html_for_extraction(self, html_content):
         """
@@ -140,30 +561,24 @@ class TextExtractor:
         Returns:
             str: Cleaned HTML with only content-relevant elements
         """
+        if SELECTOLAX_AVAILABLE:
+            try:
+                return self.clean_html_with_lexbor(html_content)
+            except Exception as e:
+                print(f"Lexbor HTML cleaning failed, falling back to BeautifulSoup: {e}")
+        
         try:
-            import re
-            from bs4 import BeautifulSoup, Comment
-            
-            # Remove HTML comments first
-            html_content = re.sub(r'<!--.*?-->', '', html_content, flags=re.DOTALL)
-            
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
             
-            # Remove any remaining comments (BeautifulSoup parsing)
+            # Remove HTML comments
             for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
                 comment.extract()
             
-            # Remove unwanted elements
-            unwanted_tags = [
-                'script', 'style', 'nav', 'footer', 'aside',
-                'iframe', 'embed', 'object', 'applet', 'form',
-                'button', 'input', 'textarea', 'select', 'option',
-                'noscript', 'meta', 'link', 'title'
-            ]
-            
-            for tag_name in unwanted_tags:
-                for tag in soup.find_all(tag_name):
-                    tag.decompose()
+            # Remove unwanted elements, all tag names in one pass; matches come in
+            # document order, so remove them last to first to reach nested ones
+            # before their ancestors
+            for tag in reversed(soup.find_all(UNWANTED_TAGS)):
+                tag.decompose()
             
             # Remove page navigation headers but preserve article headers
             for header in soup.find_all('header'):
@@ -176,54 +591,114 @@ class TextExtractor:
                 else:
                     header.decompose()  # Remove page navigation headers
             
-            # Remove elements with common non-content classes/ids
-            unwanted_selectors = [
-                '[class*="advertisement"]', '[class*="ad-"]', '[class*="ads"]',
-                '[class*="sidebar"]', '[class*="widget"]', '[class*="menu"]',
-                '[class*="nav"]', '[class*="header"]', '[class*="footer"]',
-                '[class*="social"]', '[class*="share"]', '[class*="comment"]',
-                '[id*="advertisement"]', '[id*="ad-"]', '[id*="ads"]',
-                '[id*="sidebar"]', '[id*="widget"]', '[id*="menu"]',
-                '[id*="nav"]', '[id*="header"]', '[id*="footer"]'
-            ]
-            
-            for selector in unwanted_selectors:
-                for element in soup.select(selector):
+            # Remove elements with common non-content classes/ids, all selectors in one pass
+            for element in reversed(UNWANTED_SELECTOR_MATCHER.select(soup)):
+                element.decompose()
+            
+            # Remove inline styles and other unwanted attributes while keeping essential ones,
+            # and empty elements (except br, hr, img) in the same pass, last to first so
+            # children are handled before their parents
+            for element in reversed(soup.find_all()):
+                attrs = element.attrs
+                for name in [name for name in attrs if name not in KEPT_ATTRIBUTES]:
+                    del attrs[name]
+                # stripped_strings stops at the first text, get_text would join the whole subtree
+                if element.name not in ['br', 'hr', 'img'] and next(element.stripped_strings, None) is None:
                     element.decompose()
             
-            # Remove inline styles and other unwanted attributes
-            for element in soup.find_all():
-                if element.name:
-                    # Remove style attribute
-                    if 'style' in element.attrs:
-                        del element.attrs['style']
-                    # Remove other unwanted attributes while keeping essential ones
-                    attrs_to_keep = ['href', 'src', 'alt', 'title']
-                    element.attrs = {k: v for k, v in element.attrs.items() if k in attrs_to_keep}
-            
-            # Remove empty elements (except br, hr, img)
-            for element in soup.find_all():
-                if element.name not in ['br', 'hr', 'img'] and not element.get_text(strip=True):
-                    element.decompose()
-            
-            # Convert to string and clean up multiple consecutive empty lines
-            cleaned_html = str(soup)
-            
-            # Remove multiple consecutive empty lines (keep at most 2 consecutive newlines)
-            cleaned_html = re.sub(r'\n\s*\n\s*\n+', '\n\n', cleaned_html)
-            
-            # Remove excessive whitespace between tags while preserving content spacing
-            cleaned_html = re.sub(r'>\s{3,}<', '>\n<', cleaned_html)
-            
-            # Remove leading spaces/tabs on each line (trim each line)
-            cleaned_html = re.sub(r'^[ \t]+', '', cleaned_html, flags=re.MULTILINE)
-            
-            return cleaned_html
+            # Convert to string and clean up whitespace
+            return self.collapse_html_whitespace(str(soup))
             
         except Exception as e:
             print(f"HTML cleaning failed: {e}")
             return html_content  # Return original if cleaning fails  # Return original if cleaning fails  # Return original if cleaning fails  # Return original if cleaning fails
 
+    def clean_html_with_lexbor(self, html_content):
+        """
+        Same cleaning as clean_html_for_extraction, done on a selectolax/Lexbor tree
+        The tree stays in C and Python objects are only created for the nodes we touch
+        
+        Args:
+            html_content (str): Original HTML content
+            
+        Returns:
+            str: Cleaned HTML with only content-relevant elements
+        """
+        tree = LexborHTMLParser(html_content)
+        
+        # Matches come in document order, removing them last to first never
+        # touches a node that went away with an already removed ancestor
+        def decompose_all(nodes):
+            for node in reversed(nodes):
+                node.decompose()
+        
+        # Remove unwanted elements
+        decompose_all(tree.css(UNWANTED_TAG_SELECTOR))
+        
+        # Remove page navigation headers but preserve article headers
+        decompose_all([
+            header for header in tree.css('header')
+            if not (header.css_first('h1, h2, h3') or
+                    'article' in (header.attributes.get('class') or '').lower() or
+                    'title' in (header.attributes.get('class') or '').lower() or
+                    len(header.text(strip=True)) > 30)  # Likely article header with substantial content
+        ])
+        
+        # Remove elements with common non-content classes/ids, all selectors in one pass
+        decompose_all(tree.css(UNWANTED_SELECTOR))
+        
+        # One walk for what is left: remove HTML comments and empty elements (except br, hr, img),
+        # and strip inline styles and other unwanted attributes. Each text node with visible
+        # text marks its ancestors as non-empty, stopping at the first one already marked, so
+        # no element's subtree text gets built; comments have no text, they mark nothing
+        removal_candidates = []
+        elements_with_text = set()
+        root = tree.root
+        for node in root.traverse(include_text=True):
+            if node.is_text_node:
+                if node.text_content.strip():
+                    ancestor = node.parent
+                    while ancestor is not None and ancestor not in elements_with_text:
+                        elements_with_text.add(ancestor)
+                        ancestor = ancestor.parent
+                continue
+            if node.is_comment_node:
+                removal_candidates.append(node)
+                continue
+            attrs = node.attrs
+            for name in [name for name in attrs.keys() if name not in KEPT_ATTRIBUTES]:
+                del attrs[name]
+            if node.tag not in ('br', 'hr', 'img') and node != root:
+                removal_candidates.append(node)
+        
+        # Nothing visible left (consent walls, JavaScript-only shells): the whole document is
+        # empty, and Lexbor does not allow decomposing its root
+        if root not in elements_with_text:
+            return ''
+        decompose_all([node for node in removal_candidates if node not in elements_with_text])
+        
+        # Convert to string and clean up whitespace
+        return self.collapse_html_whitespace(tree.html or '')
+
+    def collapse_html_whitespace(self, cleaned_html):
+        """
+        Collapse the whitespace the parsers keep from the source markup
+        
+        Args:
+            cleaned_html (str): Serialized cleaned HTML
+            
+        Returns:
+            str: HTML without blank line runs, long whitespace between tags or indentation
+        """
+        # Remove multiple consecutive empty lines (keep at most 2 consecutive newlines)
+        cleaned_html = BLANK_LINE_RUNS.sub('\n\n', cleaned_html)
+        
+        # Remove excessive whitespace between tags while preserving content spacing
+        cleaned_html = WHITESPACE_BETWEEN_TAGS.sub('>\n<', cleaned_html)
+        
+        # Remove leading spaces/tabs on each line (trim each line)
+        return INDENTED_LINE_START.sub('\n', cleaned_html.lstrip(' \t'))
+
     def clean_html_lightly_for_newspaper(self, html_content):
         """
         Light HTML cleaning specifically for newspaper3k extraction
@@ -236,38 +711,19 @@ class TextExtractor:
             str: Lightly cleaned HTML with preserved content structure for newspaper3k
         """
         try:
-            import re
-            from bs4 import BeautifulSoup, Comment
-            
-            # Remove HTML comments first
-            html_content = re.sub(r'<!--.*?-->', '', html_content, flags=re.DOTALL)
+            soup = BeautifulSoup(html_content, 'lxml')
             
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Remove any remaining comments (BeautifulSoup parsing)
+            # Remove HTML comments
             for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
                 comment.extract()
             
             # Remove clearly unwanted elements (more conservative than the aggressive cleaner)
-            unwanted_tags = [
-                'script', 'style', 'nav', 'footer', 'aside',
-                'iframe', 'embed', 'object', 'applet',
-                'noscript', 'meta', 'link', 'title'
-            ]
-            
-            for tag_name in unwanted_tags:
-                for tag in soup.find_all(tag_name):
-                    tag.decompose()
+            for tag in reversed(soup.find_all(LIGHT_UNWANTED_TAGS)):
+                tag.decompose()
             
             # Remove obvious advertisement elements (more conservative)
-            unwanted_selectors = [
-                '[class*="advertisement"]', '[class*="ads"]',
-                '[id*="advertisement"]', '[id*="ads"]'
-            ]
-            
-            for selector in unwanted_selectors:
-                for element in soup.select(selector):
-                    element.decompose()
+            for element in reversed(LIGHT_UNWANTED_SELECTOR_MATCHER.select(soup)):
+                element.decompose()
             
             # Remove only style attributes but keep other attributes that might help with content identification
             for element in soup.find_all():
@@ -278,7 +734,7 @@ class TextExtractor:
             cleaned_html = str(soup)
             
             # Remove excessive whitespace but be more conservative
-            cleaned_html = re.sub(r'\n\s*\n\s*\n+', '\n\n', cleaned_html)
+            cleaned_html = BLANK_LINE_RUNS.sub('\n\n', cleaned_html)
             
             return cleaned_html
             
@@ -287,15 +743,8 @@ class TextExtractor:
             return html_content  # Return original if cleaning fails
 
     def load_domain_extraction_rules(self, domain):
-        """Load domain-specific extraction rules from YAML file"""
-        config_file = os.path.join("extraction_rules", f"{domain}.yaml")
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    return yaml.safe_load(f) or {}
-            except Exception as e:
-                print(f"Warning: Could not load extraction rules for {domain}: {e}")
-        return {}
+        """Load domain-specific extraction rules from YAML file, parsed once per process"""
+        return load_extraction_rules(domain)
 
     def extract_custom_sections(self, soup, domain, url=None):
         """
@@ -310,21 +759,12 @@ class TextExtractor:
             str: Formatted custom sections content or empty string
         """
         try:
-            rules = self.load_domain_extraction_rules(domain)
-            custom_sections = rules.get('custom_content_sections', {})
-            
-            if not custom_sections.get('enabled', False):
-                return ""
-            
-            sections = custom_sections.get('sections', [])
+            # Enabled sections, already sorted by order field
+            sections, processing_options = load_custom_sections(domain)
             if not sections:
                 return ""
             
-            # Sort sections by order field
-            sections = sorted(sections, key=lambda x: x.get('order', 999))
-            
             sections_content = []
-            processing_options = custom_sections.get('processing_options', {})
             
             for section in sections:
                 content = self.extract_section_content(soup, section, processing_options, url)
@@ -366,7 +806,6 @@ class TextExtractor:
             if not content and section_name == "title" and url:
                 # Extract domain from the soup's context or use a passed domain
                 # We'll get domain from the URL
-                from urllib.parse import urlparse
                 parsed_url = urlparse(url)
                 domain = parsed_url.netloc
                 
@@ -383,8 +822,7 @@ class TextExtractor:
             clean_patterns = section_processing.get('clean_patterns', [])
             
             for pattern in clean_patterns:
-                import re
-                content = re.sub(pattern, '', content).strip()
+                content = compile_pattern(pattern).sub('', content).strip()
             
             # Apply global processing options
             if processing_options.get('trim_whitespace', True):
@@ -427,9 +865,9 @@ class TextExtractor:
                         return content
                     continue
                 
-                # Regular CSS selector
-                elements = soup.select(selector)
-                for element in elements:
+                # Regular CSS selector; matches are found lazily, so the search
+                # stops at the first element with meaningful content
+                for element in compile_selector(selector).iselect(soup):
                     # Special handling for meta tags - extract from content attribute
                     if element.name == 'meta' and element.has_attr('content'):
                         content = element['content'].strip()
@@ -457,11 +895,6 @@ class TextExtractor:
             str: Extracted content or empty string
         """
         try:
-            import json
-            import re
-            import html
-            from bs4 import BeautifulSoup as BS
-            
             # Find all script tags
             script_tags = soup.find_all('script')
             
@@ -470,19 +903,16 @@ class TextExtractor:
                 
                 # Look for variable declarations that might contain our data
                 # Handle different patterns: var lmd = {...}, window.lmd = {...}, etc.
-                var_patterns = [
-                    rf'var\s+{js_path.split(".")[0]}\s*=\s*({{.*?}});',
-                    rf'window\.{js_path.split(".")[0]}\s*=\s*({{.*?}});',
-                    rf'{js_path.split(".")[0]}\s*=\s*({{.*?}});'
-                ]
-                
-                for pattern in var_patterns:
-                    matches = re.search(pattern, script_content, re.DOTALL | re.MULTILINE)
-                    if matches:
+                for pattern in javascript_variable_patterns(js_path.split(".")[0]):
+                    declaration = pattern.search(script_content)
+                    # The object runs to the first '};' after its opening brace; str.find
+                    # scans for it once, where a lazy '{.*?};' regex backtracks character by character
+                    object_end = script_content.find('};', declaration.end()) if declaration else -1
+                    if object_end != -1:
                         try:
                             # Parse the JSON object
-                            json_str = matches.group(1)
-                            data = json.loads(json_str)
+                            json_str = script_content[declaration.end() - 1:object_end + 1]
+                            data = load_json(json_str)
                             
                             # Navigate the object path
                             path_parts = js_path.split('.')[1:]  # Skip the variable name
@@ -498,7 +928,7 @@ class TextExtractor:
                             if current and isinstance(current, str):
                                 # Clean up HTML content: decode entities and strip tags
                                 decoded = html.unescape(current)  # Decode HTML entities like &nbsp;
-                                soup_temp = BS(decoded, 'html.parser')
+                                soup_temp = BeautifulSoup(decoded, 'lxml')
                                 clean_text = soup_temp.get_text(separator=' ', strip=True)  # Strip HTML tags with space separator
                                 return clean_text
                                 
@@ -557,13 +987,13 @@ class TextExtractor:
         
         # Simple check: if significant portion of custom content appears in main content
         custom_words = set(custom_content.lower().split())
-        main_words = set(main_content.lower().split())
         
         if len(custom_words) < 3:  # Too short to check meaningfully
             return False
         
-        # Calculate overlap
-        overlap = len(custom_words.intersection(main_words))
+        # Calculate overlap; intersection() takes the main words as they come,
+        # no set of the whole article gets built
+        overlap = len(custom_words.intersection(main_content.lower().split()))
         similarity = overlap / len(custom_words)
         
         return similarity >= threshold
@@ -580,49 +1010,15 @@ class TextExtractor:
             str: Extracted title or empty string
         """
         try:
-            import re
-            from urllib.parse import urlparse
-            
             # Domain-specific URL title extraction patterns
-            if domain == "www.lemonde.fr":
-                # Le Monde URLs: extract slug and convert to readable title
-                # Example: katrina-l-ouragan-infernal-sur-netflix-vingt-ans-apres-spike-lee-prend-le-pouls-de-la-nouvelle-orleans
-                parsed = urlparse(url)
-                path = parsed.path
-                
-                # Extract the article slug (last part before article ID)
-                # Pattern: /article-slug_ARTICLEID_CATEGORYID.html
-                match = re.search(r'/([^/]+)_\d+_\d+\.html$', path)
-                if match:
-                    slug = match.group(1)
-                    
-                    # Convert slug to readable title
-                    title = self.convert_slug_to_title(slug, "fr")
-                    return title
-                    
-            elif domain == "www.bzi.ro":
-                # BZI.ro URLs: similar pattern
-                parsed = urlparse(url)
-                path = parsed.path
+            rule = URL_TITLE_RULES.get(domain)
+            if rule:
+                slug_pattern, language = rule
                 
-                # Extract the article slug (before article ID)
-                match = re.search(r'/([^/]+)-\d+$', path)
+                # Extract the article slug (before the article ID) and convert it to a readable title
+                match = slug_pattern.search(urlsplit(url).path)
                 if match:
-                    slug = match.group(1)
-                    title = self.convert_slug_to_title(slug, "ro")
-                    return title
-                    
-            elif domain == "www.digi24.ro":
-                # Digi24.ro URLs: similar pattern
-                parsed = urlparse(url)
-                path = parsed.path
-                
-                # Extract the article slug (before article ID)
-                match = re.search(r'/([^/]+)-(\d+)$', path)
-                if match:
-                    slug = match.group(1)
-                    title = self.convert_slug_to_title(slug, "ro")
-                    return title
+                    return self.convert_slug_to_title(match.group(1), language)
                     
             return ""
             
@@ -645,46 +1041,16 @@ class TextExtractor:
             # Replace dashes with spaces
             words = slug.split('-')
             
-            # Language-specific title formatting
-            if language == "fr":
-                # French: capitalize first word and proper nouns
-                formatted_words = []
-                for i, word in enumerate(words):
-                    if i == 0:
-                        # Capitalize first word
-                        formatted_words.append(word.capitalize())
-                    elif word.lower() in ['le', 'la', 'les', 'de', 'du', 'des', 'à', 'au', 'aux', 'et', 'ou', 'pour', 'sur', 'avec', 'sans', 'dans', 'par', 'un', 'une']:
-                        # Keep articles and prepositions lowercase
-                        formatted_words.append(word.lower())
-                    elif len(word) > 3:
-                        # Capitalize longer words (likely proper nouns or important words)
-                        formatted_words.append(word.capitalize())
-                    else:
-                        formatted_words.append(word.lower())
-                        
-            elif language == "ro":
-                # Romanian: similar rules
-                formatted_words = []
-                for i, word in enumerate(words):
-                    if i == 0:
-                        formatted_words.append(word.capitalize())
-                    elif word.lower() in ['de', 'la', 'în', 'cu', 'pe', 'din', 'pentru', 'prin', 'după', 'înainte', 'fără', 'și', 'sau', 'dar', 'iar', 'un', 'o']:
-                        formatted_words.append(word.lower())
-                    elif len(word) > 3:
-                        formatted_words.append(word.capitalize())
-                    else:
-                        formatted_words.append(word.lower())
-                        
-            else:
-                # Default: capitalize each word except short articles/prepositions
-                formatted_words = []
-                for i, word in enumerate(words):
-                    if i == 0:
-                        formatted_words.append(word.capitalize())
-                    elif word.lower() in ['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by']:
-                        formatted_words.append(word.lower())
-                    else:
-                        formatted_words.append(word.capitalize())
+            # Language-specific title formatting, English rules for other languages:
+            # capitalize the first word, keep articles, prepositions and short words lowercase
+            lowercase_words, max_lowercase_length = SLUG_TITLE_RULES.get(language, SLUG_TITLE_RULES['en'])
+            formatted_words = [words[0].capitalize()]
+            for word in words[1:]:
+                lower_word = word.lower()
+                if lower_word in lowercase_words or len(word) <= max_lowercase_length:
+                    formatted_words.append(lower_word)
+                else:
+                    formatted_words.append(word.capitalize())
             
             return ' '.join(formatted_words)
             
@@ -699,55 +1065,83 @@ class TextExtractor:
         Preserves bold, italic, and other important formatting
         
         Args:
-            html_content (str): Original HTML content
+            html_content (str): Original HTML content, bytes are decoded like a file read by process_html_file
             
         Returns:
             str: HTML with Markdown formatting markers
         """
+        # BeautifulSoup would guess the encoding of bytes with its charset detection
+        if isinstance(html_content, bytes):
+            html_content = decode_html(html_content)
+        
         try:
-            from bs4 import BeautifulSoup, NavigableString
-            import re
-            
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
+            
+            # One find_all collects the formatting tags of every kind in document order, each
+            # conversion below takes its kind from that list. Tags left inside a tag replaced
+            # earlier are out of the document, converting them changes nothing. Tags under an
+            # underline rewritten in place are detached though, replace_with would raise on
+            # them, so they are skipped. A replacement parsed from markup can bring in new
+            # formatting tags, the next kind collects again
+            formatting_tags = None
+            
+            def tags_named(names):
+                nonlocal formatting_tags
+                if formatting_tags is None:
+                    formatting_tags = soup.find_all(FORMATTING_TAGS)
+                return [tag for tag in formatting_tags if tag.name in names and tag.parent is not None]
+            
+            def replace_with_markdown(tag, new_content):
+                nonlocal formatting_tags
+                replacement = self._parse_markdown_fragment(new_content)
+                if not isinstance(replacement, str):
+                    formatting_tags = None
+                tag.replace_with(replacement)
             
             # Convert bold tags to Markdown - handle complex nested content
-            for tag in soup.find_all(['b', 'strong']):
+            for tag in tags_named(('b', 'strong')):
                 # Get all text content from the tag, preserving nested structure
                 text_content = self._get_formatted_content(tag)
                 if text_content.strip():
                     # Replace the entire tag with Markdown-wrapped content
                     new_content = f"**{text_content}**"
-                    tag.replace_with(BeautifulSoup(new_content, 'html.parser'))
+                    replace_with_markdown(tag, new_content)
             
             # Convert italic tags to Markdown
-            for tag in soup.find_all(['i', 'em']):
+            for tag in tags_named(('i', 'em')):
                 text_content = self._get_formatted_content(tag)
                 if text_content.strip():
                     new_content = f"*{text_content}*"
-                    tag.replace_with(BeautifulSoup(new_content, 'html.parser'))
+                    replace_with_markdown(tag, new_content)
             
             # Convert underline tags to Markdown (using HTML since Markdown doesn't have native underline)
-            for tag in soup.find_all('u'):
+            for tag in tags_named(('u',)):
                 text_content = self._get_formatted_content(tag)
                 if text_content.strip():
-                    new_content = f"<u>{text_content}</u>"
-                    tag.replace_with(BeautifulSoup(new_content, 'html.parser'))
+                    if '<' in text_content or '&' in text_content:
+                        new_content = f"<u>{text_content}</u>"
+                        tag.replace_with(BeautifulSoup(new_content, 'html.parser'))
+                        formatting_tags = None
+                    else:
+                        # What parsing "<u>text</u>" gives: the tag without attributes, holding just the text
+                        tag.attrs = {}
+                        tag.string = text_content
             
             # Convert code tags to Markdown
-            for tag in soup.find_all(['code', 'tt']):
+            for tag in tags_named(('code', 'tt')):
                 text_content = self._get_formatted_content(tag)
                 if text_content.strip():
                     new_content = f"`{text_content}`"
-                    tag.replace_with(BeautifulSoup(new_content, 'html.parser'))
+                    replace_with_markdown(tag, new_content)
             
             # Convert blockquotes to Markdown
-            for tag in soup.find_all('blockquote'):
+            for tag in tags_named(('blockquote',)):
                 text_content = tag.get_text()
                 if text_content.strip():
                     lines = text_content.strip().split('\n')
                     quoted_lines = [f"> {line.strip()}" for line in lines if line.strip()]
                     new_content = '\n'.join(quoted_lines) + '\n'
-                    tag.replace_with(BeautifulSoup(new_content, 'html.parser'))
+                    replace_with_markdown(tag, new_content)
             
             # Handle headers - preserve them as HTML since we have header detection later
             # This ensures consistent header processing
@@ -756,12 +1150,8 @@ class TextExtractor:
             formatted_html = str(soup)
             
             # Clean up extra spaces around Markdown markers
-            formatted_html = re.sub(r'\*\*\s+', '**', formatted_html)
-            formatted_html = re.sub(r'\s+\*\*', '**', formatted_html)
-            formatted_html = re.sub(r'(?<!\*)\*\s+', '*', formatted_html)
-            formatted_html = re.sub(r'\s+\*(?!\*)', '*', formatted_html)
-            formatted_html = re.sub(r'`\s+', '`', formatted_html)
-            formatted_html = re.sub(r'\s+`', '`', formatted_html)
+            for pattern, replacement in MARKDOWN_MARKER_SPACING:
+                formatted_html = pattern.sub(replacement, formatted_html)
             
             return formatted_html
             
@@ -769,6 +1159,22 @@ class TextExtractor:
             print(f"HTML formatting preservation failed: {e}")
             return html_content  # Return original if processing fails
     
+    def _parse_markdown_fragment(self, new_content):
+        """
+        Parse the Markdown-wrapped content that replaces a formatting tag
+        Without markup or entities html.parser would return the text as a single string,
+        so the text itself is the replacement instead of starting a parser per tag
+        
+        Args:
+            new_content (str): Markdown-wrapped tag content
+            
+        Returns:
+            str or BeautifulSoup: Replacement for the tag, replace_with makes a str a text node
+        """
+        if '<' not in new_content and '&' not in new_content:
+            return new_content
+        return BeautifulSoup(new_content, 'html.parser')
+
     def _get_formatted_content(self, tag):
         """
         Extract formatted content from a tag, preserving nested links and other elements
@@ -819,49 +1225,13 @@ class TextExtractor:
             str: Cleaned text with proper Markdown formatting
         """
         try:
-            import re
-            
             if not text:
                 return text
             
-            # Fix broken bold formatting ONLY when it's clearly broken across lines within a sentence
-            # Don't remove newlines that separate paragraphs or sections
-            # Only fix if there's text immediately before and after the break (indicating broken formatting)
-            # Use [ \t] to match only spaces and tabs, not newlines
-            text = re.sub(r'(\w)\*\*[ \t]*\n[ \t]*(\w)', r'\1**\2', text)  # Fix broken bold within text
-            text = re.sub(r'(\w)[ \t]*\n[ \t]*\*\*(\w)', r'\1**\2', text)  # Fix broken bold within text
-            
-            # Fix broken italic formatting (same logic)
-            text = re.sub(r'(\w)\*[ \t]*\n[ \t]*(\w)', r'\1*\2', text)
-            text = re.sub(r'(\w)[ \t]*\n[ \t]*\*(?!\*)(\w)', r'\1*\2', text)
-            
-            # Fix broken code formatting (same logic)
-            text = re.sub(r'(\w)`[ \t]*\n[ \t]*(\w)', r'\1`\2', text)
-            text = re.sub(r'(\w)[ \t]*\n[ \t]*`(\w)', r'\1`\2', text)
-            
-            # Remove empty bold/italic tags - FIXED: be more specific to avoid matching valid bold formatting
-            text = re.sub(r'\*\*\s*\*\*', '', text)  # Remove empty bold tags like ** **
-            # FIXED: Only match single * followed by whitespace and another single * (true empty italic tags)
-            # This avoids matching ** (bold markers)
-            text = re.sub(r'(?<!\*)\*\s+\*(?!\*)', '', text)  # Remove empty italic tags like * * but not **
-            text = re.sub(r'``', '', text)  # Remove empty code tags
-            
-            # Fix multiple consecutive formatting markers
-            text = re.sub(r'\*{3,}', '**', text)
-            
-            # Ensure proper spacing around formatting - but don't break existing good formatting
-            # Only add space before bold if there's no space already
-            text = re.sub(r'(\w)(\*\*\w)', r'\1 \2', text)  # Add space before bold if missing
-            # Only add space before italic if there's no space already and it's not part of bold
-            text = re.sub(r'(\w)(\*(?!\*)\w)', r'\1 \2', text)  # Add space before italic if missing
-            
-            # Clean up excessive whitespace but preserve paragraph breaks
-            # Replace multiple spaces (but not newlines) with single space
-            text = re.sub(r'[ \t]{2,}', ' ', text)
-            # Replace more than 2 consecutive newlines with exactly 2 (paragraph break)
-            text = re.sub(r'\n{3,}', '\n\n', text)
-            # Remove trailing spaces from lines
-            text = re.sub(r'[ \t]+\n', '\n', text)
+            for pattern, replacement, marker in MARKDOWN_CLEANUP_RULES:
+                # Articles without any bold, italic or code skip the rules for them
+                if marker is None or marker in text:
+                    text = pattern.sub(replacement, text)
             
             # Fix blockquote formatting that may have been disrupted
             lines = text.split('\n')
@@ -895,8 +1265,6 @@ class TextExtractor:
             str: Text with proper paragraph separation
         """
         try:
-            import re
-            
             if not text:
                 return text
             
@@ -906,44 +1274,33 @@ class TextExtractor:
             for i, line in enumerate(lines):
                 stripped_line = line.strip()
                 
+                # Add current line
+                processed_lines.append(line)
+                
                 # Skip empty lines
                 if not stripped_line:
-                    processed_lines.append(line)
                     continue
                 
-                # Add current line
-                processed_lines.append(line)
-                
                 # Check if this line should be followed by a paragraph break
                 # Heuristics for paragraph endings:
                 # 1. Lines ending with sentence-ending punctuation
                 # 2. Followed by a line that starts a new thought/sentence
                 # 3. Not if the next line is a header or already has spacing
+                # (an empty next line is spacing already)
                 
-                if i < len(lines) - 1:  # Not the last line
+                if i < len(lines) - 1 and stripped_line.endswith(SENTENCE_ENDINGS):  # Not the last line, ends a sentence
                     next_line = lines[i + 1].strip()
                     
-                    # Check if current line ends a sentence/paragraph
-                    ends_sentence = stripped_line.endswith(('.', '!', '?', '"', '"', '".', '".', '".'))
-                    
                     # Check if next line starts a new paragraph/thought
                     starts_new_thought = (
                         next_line and  # Next line has content
-                        not next_line.startswith(('#', '>', '-', '*', '1.', '2.', '3.')) and  # Not a header, quote, or list
-                        (next_line[0].isupper() or next_line.startswith('"') or next_line.startswith('"')) and  # Starts with capital or quote
-                        not any(next_line.startswith(word) for word in ['și ', 'dar ', 'iar ', 'sau ', 'însă ', 'pentru că ', 'deoarece '])  # Not a continuation word
+                        not next_line.startswith(NON_PARAGRAPH_PREFIXES) and  # Not a header, quote, or list
+                        (next_line[0].isupper() or next_line[0] == '"') and  # Starts with capital or quote
+                        not next_line.startswith(CONTINUATION_WORDS)  # Not a continuation word
                     )
                     
-                    # Add paragraph break if conditions are met
-                    if (ends_sentence and starts_new_thought and 
-                        next_line != '' and  # Next line is not empty
-                        len(processed_lines) > 0 and processed_lines[-1].strip() != ''):  # Current line is not empty
-                        
-                        # Check if there's already a paragraph break
-                        if i + 1 < len(lines) and lines[i + 1].strip() == '':
-                            continue  # Already has spacing
-                        
-                        # Add paragraph break
+                    # Add paragraph break
+                    if starts_new_thought:
                         processed_lines.append('')
             
             return '\n'.join(processed_lines)
@@ -961,11 +1318,24 @@ class TextExtractor:
     def extract_with_trafilatura(self, html_content, original_url=""):
         """Extract article content using trafilatura"""
         try:
+            # Imported on first use, runs with the other method never load it
+            import trafilatura
+            from trafilatura.utils import load_html
+            
+            # Parse once for both calls, the string itself when trafilatura can't build a tree from it
+            tree = load_html(html_content)
+            if tree is None:
+                tree = html_content
+            
+            # Extract metadata (without fast parameter), before extract() gets to prune the tree
+            metadata = trafilatura.extract_metadata(tree)
+            
             # Extract text content
-            text = trafilatura.extract(html_content, 
+            text = trafilatura.extract(tree, 
                                      include_comments=False,
                                      include_tables=True,
                                      include_links=False,
+                                     fast=self.fast_extraction,
                                      url=original_url)
             
             # For trafilatura, we need to manually add paragraph breaks
@@ -984,22 +1354,51 @@ class TextExtractor:
                 # Join lines and ensure proper paragraph spacing
                 text = '\n'.join(formatted_lines)
                 # Convert single newlines between content to double newlines
-                import re
-                text = re.sub(r'\n(?=\S)', '\n\n', text)
-            
-            # Extract metadata (without fast parameter)
-            metadata = trafilatura.extract_metadata(html_content)
+                text = LINE_BREAK_BEFORE_CONTENT.sub('\n\n', text)
             
             return text, metadata
         except Exception as e:
             print(f"Trafilatura extraction failed for {original_url}: {e}")
             return None, None
 
+    def extract_with_resiliparse(self, html_content, original_url=""):
+        """Extract article content using Resiliparse, with metadata read from the same parsed tree"""
+        try:
+            tree = HTMLTree.parse(html_content)
+            
+            # Extract main content text, same content options as the trafilatura method
+            text = extract_plain_text(tree,
+                                      main_content=True,
+                                      preserve_formatting=True,
+                                      alt_texts=False,
+                                      links=False,
+                                      comments=False)
+            
+            # Resiliparse already puts blank lines between paragraphs, make every
+            # remaining line break one too, like the trafilatura output
+            text = '\n\n'.join(line.strip() for line in text.split('\n') if line.strip())
+            
+            # Create metadata object similar to trafilatura
+            metadata = ResiliparseMetadata(tree, original_url)
+            
+            return text or None, metadata
+        except Exception as e:
+            print(f"Resiliparse extraction failed for {original_url}: {e}")
+            return None, None
+
     def extract_with_newspaper(self, html_content, original_url=""):
         """Extract article content using newspaper3k"""
         try:
+            # Imported on first use, runs with the other method never load it
+            from newspaper import Article, Config
+            
+            # Only text, title, authors and date are used: without fetch_images, parse() would
+            # download the article's candidate images over HTTP just to pick a top image
+            config = Config()
+            config.fetch_images = False
+            
             # Create Article object
-            article = Article(original_url)
+            article = Article(original_url, config=config)
             article.set_html(html_content)
             article.parse()
             
@@ -1012,14 +1411,7 @@ class TextExtractor:
                 text = '\n\n'.join(paragraph.strip() for paragraph in paragraphs if paragraph.strip())
             
             # Create metadata object similar to trafilatura
-            class NewspaperMetadata:
-                def __init__(self, article):
-                    self.title = article.title
-                    self.author = ', '.join(article.authors) if article.authors else None
-                    self.date = article.publish_date.strftime('%Y-%m-%d') if article.publish_date else None
-                    self.url = original_url
-            
-            metadata = NewspaperMetadata(article)
+            metadata = NewspaperMetadata(article, original_url)
             
             return text, metadata
             
@@ -1036,22 +1428,14 @@ class TextExtractor:
         html_headers = {}
         if html_content:
             try:
-                from bs4 import BeautifulSoup
-                import unicodedata
-                
-                soup = BeautifulSoup(html_content, 'html.parser')
-                
                 # Find all header tags and map their text to header levels
-                for level in range(1, 7):  # h1 to h6
-                    headers = soup.find_all(f'h{level}')
-                    for header in headers:
-                        header_text = header.get_text(strip=True)
-                        if header_text and len(header_text) > 3:
-                            # Normalize text for better matching
-                            normalized = unicodedata.normalize('NFKC', header_text)
-                            html_headers[normalized] = level
-                            # Also store original for exact matching
-                            html_headers[header_text] = level
+                for level, header_text in self.find_html_headers(html_content):
+                    if header_text and len(header_text) > 3:
+                        # Normalize text for better matching
+                        normalized = unicodedata.normalize('NFKC', header_text)
+                        html_headers[normalized] = level
+                        # Also store original for exact matching
+                        html_headers[header_text] = level
             except Exception as e:
                 # If HTML parsing fails, fall back to heuristic method
                 pass
@@ -1073,10 +1457,9 @@ class TextExtractor:
             if stripped in html_headers:
                 is_header = True
                 header_level = html_headers[stripped]
-            else:
+            elif html_headers:
                 # Try normalized match
                 try:
-                    import unicodedata
                     normalized = unicodedata.normalize('NFKC', stripped)
                     if normalized in html_headers:
                         is_header = True
@@ -1095,8 +1478,8 @@ class TextExtractor:
                 
                 if (len(stripped) < 80 and 
                     len(stripped) > 5 and
-                    not stripped.endswith(('.', '!', ':', ';', ',') ) and  # Allow ? for question headers
-                    not stripped.startswith(('În ', 'De ', 'Cu ', 'Pentru ', 'Prin ', 'Astfel', 'Așa', 'Dar', 'Și')) and
+                    not stripped.endswith(NON_HEADER_ENDINGS) and  # Allow ? for question headers
+                    not stripped.startswith(NON_HEADER_PREFIXES) and
                     # Check if next non-empty line exists and looks like content
                     self._next_line_looks_like_content(lines, i)):
                     
@@ -1105,10 +1488,8 @@ class TextExtractor:
                     # Determine header level based on context and formatting
                     if i == 0 or (i < 3 and not any(formatted_lines[-3:])):  # First meaningful line
                         header_level = 1
-                    elif any(keyword in stripped.lower() for keyword in ['actualizare', 'știrea inițială', 'concluzia', 'background', 'ce s-a întâmplat']):
-                        header_level = 2
                     else:
-                        header_level = 2  # Default secondary header
+                        header_level = 2  # Secondary header, update/background/conclusion sections included
             
             if is_header:
                 # Ensure empty line before header (but not if it's the first line or already has empty line)
@@ -1130,15 +1511,36 @@ class TextExtractor:
                 
         return '\n'.join(formatted_lines)
     
+    def find_html_headers(self, html_content):
+        """
+        Find the text of the h1-h6 headers in HTML, on a selectolax/Lexbor tree when available
+        
+        Args:
+            html_content (str): HTML content
+            
+        Returns:
+            list: (level, text) pairs, h1 headers first and each level in document order
+        """
+        if SELECTOLAX_AVAILABLE:
+            tree = LexborHTMLParser(html_content)
+            return [(level, header.text(strip=True))
+                    for level in range(1, 7)  # h1 to h6
+                    for header in tree.css(f'h{level}')]
+        
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=HEADER_STRAINER)
+        return [(level, header.get_text(strip=True))
+                for level in range(1, 7)  # h1 to h6
+                for header in soup.find_all(f'h{level}')]
+    
     def _next_line_looks_like_content(self, lines, current_index):
         """Check if the next non-empty line looks like content rather than another header"""
-        for i in range(current_index + 1, min(len(lines), current_index + 3)):
-            if i < len(lines) and lines[i].strip():
-                next_line = lines[i].strip()
+        for next_line in lines[current_index + 1:current_index + 3]:
+            next_line = next_line.strip()
+            if next_line:
                 # Content indicators: longer lines, starts with common content words, ends with punctuation
                 return (len(next_line) > 50 or 
-                       next_line.endswith(('.', '!', '?', ':', ';')) or
-                       any(next_line.startswith(word) for word in ['În ', 'De ', 'Cu ', 'Pentru ', 'Prin ', 'Acest', 'Potrivit', 'După']))
+                       next_line.endswith(CONTENT_ENDINGS) or
+                       next_line.startswith(CONTENT_START_WORDS))
         return False
 
     def reconstruct_url(self, domain, file_path):
@@ -1152,14 +1554,50 @@ class TextExtractor:
         url_path = filename.replace('.html', '').replace('_', '/')
         return f"https://{domain}/{url_path}"
 
+    def content_relative_path(self, file_path):
+        """Path of a file relative to CONTENT_DIR, sliced off the paths find_html_files builds instead of os.path.relpath"""
+        # relpath makes both paths absolute first, two getcwd calls per file
+        prefix = CONTENT_DIR + os.sep
+        if file_path.startswith(prefix):
+            return file_path[len(prefix):]
+        return os.path.relpath(file_path, CONTENT_DIR)
+
     def process_html_file(self, file_path, domain):
         """Process a single HTML file using the selected extraction method"""
         file_key = f"{domain}:{file_path}"
+        content_hash = None
+        file_stat = None
+        # One timestamp for everything recorded about this file
+        processed_at = datetime.now().isoformat()
         
         try:
-            # Read HTML content
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                original_html_content = f.read()
+            # A file skipped before with the same size, modification time and extraction method
+            # would be skipped again, there is no need to read it
+            file_stat = os.stat(file_path)
+            previous_status = self.processed_status.get(file_key, {})
+            skipped_before = (previous_status.get('status') == 'skipped' and
+                              previous_status.get('extraction_method') == self.extraction_method)
+            if (skipped_before and
+                previous_status.get('size') == file_stat.st_size and
+                previous_status.get('mtime') == file_stat.st_mtime):
+                self.stats['already_processed'] += 1
+                print(f"⏭️  Already processed, unchanged ({domain}): {os.path.basename(file_path)}")
+                return
+            
+            # Read HTML content as bytes, hashed as is and decoded in a single call
+            with open(file_path, 'rb') as f:
+                html_bytes = f.read()
+            original_html_content = decode_html(html_bytes)
+            if '\r' in original_html_content:
+                # Same newlines as a text mode read
+                original_html_content = original_html_content.replace('\r\n', '\n').replace('\r', '\n')
+            
+            # Same for a touched file with the same content
+            content_hash = hashlib.blake2b(html_bytes, digest_size=16).hexdigest()
+            if skipped_before and previous_status.get('content_hash') == content_hash:
+                self.stats['already_processed'] += 1
+                print(f"⏭️  Already processed, unchanged ({domain}): {os.path.basename(file_path)}")
+                return
             
             # Check for empty or very small HTML files
             if len(original_html_content.strip()) < 200:
@@ -1170,7 +1608,9 @@ class TextExtractor:
                 self.processed_status[file_key] = {
                     'status': 'skipped',
                     'reason': reason,
-                    'processed_at': datetime.now().isoformat()
+                    'processed_at': processed_at,
+                    'content_hash': content_hash,
+                    'extraction_method': self.extraction_method
                 }
                 return
             
@@ -1181,8 +1621,8 @@ class TextExtractor:
             original_url = self.reconstruct_url(domain, file_path)
             
             # Use different cleaning strategies based on extraction method
-            if self.extraction_method == 'trafilatura':
-                # Trafilatura is robust, use more aggressive cleaning
+            if self.extraction_method in ['trafilatura', 'resiliparse']:
+                # Trafilatura and Resiliparse are robust, use more aggressive cleaning
                 cleaned_html_content = self.clean_html_for_extraction(formatted_html_content)
                 
                 # Check if cleaning removed too much content
@@ -1194,11 +1634,20 @@ class TextExtractor:
                     self.processed_status[file_key] = {
                         'status': 'skipped',
                         'reason': reason,
-                        'processed_at': datetime.now().isoformat()
+                        'processed_at': processed_at,
+                        'content_hash': content_hash,
+                        'extraction_method': self.extraction_method
                     }
                     return
                 
-                extracted_text, extracted_metadata = self.extract_with_trafilatura(cleaned_html_content, original_url)
+                if self.extraction_method == 'resiliparse':
+                    extracted_text, extracted_metadata = self.extract_with_resiliparse(cleaned_html_content, original_url)
+                    
+                    # Trafilatura's heuristics sometimes find content where Resiliparse found none
+                    if not extracted_text:
+                        extracted_text, extracted_metadata = self.extract_with_trafilatura(cleaned_html_content, original_url)
+                else:
+                    extracted_text, extracted_metadata = self.extract_with_trafilatura(cleaned_html_content, original_url)
                 
             elif self.extraction_method == 'newspaper':
                 # Newspaper3k needs more HTML structure, use lighter cleaning
@@ -1213,7 +1662,9 @@ class TextExtractor:
                     self.processed_status[file_key] = {
                         'status': 'skipped',
                         'reason': reason,
-                        'processed_at': datetime.now().isoformat()
+                        'processed_at': processed_at,
+                        'content_hash': content_hash,
+                        'extraction_method': self.extraction_method
                     }
                     return
                 
@@ -1224,20 +1675,19 @@ class TextExtractor:
                 raise ValueError(f"Unknown extraction method: {self.extraction_method}")
             
             # Extract custom sections from original HTML (before cleaning to preserve script tags)
-            from bs4 import BeautifulSoup
-            soup_original = BeautifulSoup(formatted_html_content, 'html.parser')
+            soup_original = BeautifulSoup(formatted_html_content, 'lxml')
             custom_sections = self.extract_custom_sections(soup_original, domain, original_url)
             
             # Save cleaned HTML if requested
             cleaned_html_saved = False
             full_cleaned_path = ""
             if self.save_cleaned_html:
-                rel_path = os.path.relpath(file_path, CONTENT_DIR)
+                rel_path = self.content_relative_path(file_path)
                 cleaned_path = rel_path.replace('/raw/', '/cleaned/')
                 full_cleaned_path = os.path.join(CONTENT_DIR, cleaned_path)
                 
                 # Create cleaned directory
-                os.makedirs(os.path.dirname(full_cleaned_path), exist_ok=True)
+                self.make_directory(os.path.dirname(full_cleaned_path))
                 
                 # Save cleaned HTML
                 with open(full_cleaned_path, 'w', encoding='utf-8') as f:
@@ -1259,7 +1709,9 @@ class TextExtractor:
                 self.processed_status[file_key] = {
                     'status': 'skipped',
                     'reason': reason,
-                    'processed_at': datetime.now().isoformat()
+                    'processed_at': processed_at,
+                    'content_hash': content_hash,
+                    'extraction_method': self.extraction_method
                 }
                 return
             
@@ -1282,13 +1734,21 @@ class TextExtractor:
                 self.processed_status[file_key] = {
                     'status': 'skipped',
                     'reason': reason,
-                    'processed_at': datetime.now().isoformat()
+                    'processed_at': processed_at,
+                    'content_hash': content_hash,
+                    'extraction_method': self.extraction_method
                 }
                 return
             
             # Check for extraction that only contains repetitive content
             words = extracted_text_clean.split()
-            unique_words = set(words)
+            # The unique count only grows, so stop adding words once the ratio can no
+            # longer drop below the threshold; repetitive texts still get counted in full
+            unique_words = set()
+            for start in range(0, len(words), 256):
+                unique_words.update(words[start:start + 256])
+                if len(unique_words) / len(words) >= 0.1:
+                    break
             if len(words) > 20 and len(unique_words) / len(words) < 0.1:  # Less than 10% unique words
                 self.stats['skipped_files'] += 1
                 reason = f"Extracted text appears repetitive (unique word ratio: {len(unique_words)/len(words):.2%})"
@@ -1303,7 +1763,9 @@ class TextExtractor:
                 self.processed_status[file_key] = {
                     'status': 'skipped',
                     'reason': reason,
-                    'processed_at': datetime.now().isoformat()
+                    'processed_at': processed_at,
+                    'content_hash': content_hash,
+                    'extraction_method': self.extraction_method
                 }
                 return
             
@@ -1352,7 +1814,7 @@ class TextExtractor:
                     metadata['date'] = extracted_metadata.date
             
             # Generate output paths
-            rel_path = os.path.relpath(file_path, CONTENT_DIR)
+            rel_path = self.content_relative_path(file_path)
             extracted_path = rel_path.replace('/raw/', '/extracted/').replace('.html', '.md')
             metadata_path = rel_path.replace('/raw/', '/metadata/').replace('.html', '.yaml')
             
@@ -1360,16 +1822,15 @@ class TextExtractor:
             full_metadata_path = os.path.join(CONTENT_DIR, metadata_path)
             
             # Create output directories
-            os.makedirs(os.path.dirname(full_extracted_path), exist_ok=True)
-            os.makedirs(os.path.dirname(full_metadata_path), exist_ok=True)
+            self.make_directory(os.path.dirname(full_extracted_path))
+            self.make_directory(os.path.dirname(full_metadata_path))
             
             # Save markdown content
-            with open(full_extracted_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            write_atomically(full_extracted_path, markdown_content.encode('utf-8'))
             
             # Save metadata
             metadata.update({
-                'extracted_at': datetime.now().isoformat(),
+                'extracted_at': processed_at,
                 'source_file': file_path,
                 'markdown_file': full_extracted_path,
                 'content_length': len(markdown_content),
@@ -1381,8 +1842,7 @@ class TextExtractor:
             if self.save_cleaned_html:
                 metadata['cleaned_html_file'] = full_cleaned_path
             
-            with open(full_metadata_path, 'w', encoding='utf-8') as f:
-                yaml.dump(metadata, f, default_flow_style=False, allow_unicode=True)
+            write_atomically(full_metadata_path, dump_metadata_yaml(metadata))
             
             # Update status
             status_entry = {
@@ -1391,7 +1851,8 @@ class TextExtractor:
                 'metadata_file': full_metadata_path,
                 'content_length': len(markdown_content),
                 'extraction_method': self.extraction_method,
-                'processed_at': datetime.now().isoformat(),
+                'processed_at': processed_at,
+                'content_hash': content_hash,
                 'custom_sections_found': bool(custom_sections)
             }
             
@@ -1424,33 +1885,89 @@ class TextExtractor:
             self.processed_status[file_key] = {
                 'status': 'error',
                 'error': str(e),
-                'processed_at': datetime.now().isoformat()
+                'processed_at': processed_at,
+                'content_hash': content_hash
             }
+        finally:
+            # Record size and modification time with the status entry for this content,
+            # the next run compares them before reading the file
+            status_entry = self.processed_status.get(file_key)
+            if file_stat and status_entry and status_entry.get('content_hash') == content_hash:
+                status_entry['size'] = file_stat.st_size
+                status_entry['mtime'] = file_stat.st_mtime
         
         self.stats['total_processed'] += 1
 
+    def process_html_files(self, files):
+        """
+        Process (file_path, domain) pairs, across worker processes when there is more than one file
+        Status and stats are collected here, the workers only write the extraction outputs and logs
+        
+        Args:
+            files (list): (file_path, domain) pairs to process
+            
+        Returns:
+            int: Number of successful extractions
+        """
+        prev_successful = self.stats['successful_extractions']
+        if not files:
+            return 0
+        
+        if self.workers > 1 and len(files) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(files)),
+                                     mp_context=multiprocessing.get_context(EXTRACTION_START_METHOD),
+                                     initializer=init_extraction_worker,
+                                     initargs=(self.extraction_method, self.save_cleaned_html, self.fast_extraction)) as executor:
+                # Workers get the file's previous status entry along with it, for the unchanged content check
+                items = [(file_path, domain, self.processed_status.get(f"{domain}:{file_path}")) for file_path, domain in files]
+                results = executor.map(extract_file, items, chunksize=EXTRACTION_CHUNK_SIZE)
+                for (_, _, previous_status), (file_key, status_entry, file_stats) in zip(items, results):
+                    self.processed_status[file_key] = status_entry
+                    for name, count in file_stats.items():
+                        self.stats[name] += count
+                    # Files skipped as unchanged keep their entry, there is nothing new to journal
+                    if status_entry != previous_status:
+                        self.journal_status(file_key)
+        else:
+            for file_path, domain in files:
+                file_key = f"{domain}:{file_path}"
+                # A copy, a touched file with unchanged content gets its size and mtime updated in place
+                previous_status = dict(self.processed_status.get(file_key) or {})
+                self.process_html_file(file_path, domain)
+                if self.processed_status.get(file_key, {}) != previous_status:
+                    self.journal_status(file_key)
+        
+        return self.stats['successful_extractions'] - prev_successful
+
     def find_html_files(self):
         """Find all HTML files to process"""
         html_files = []
         if not os.path.exists(CONTENT_DIR):
             return html_files
         
-        for root, dirs, files in os.walk(CONTENT_DIR):
-            if 'raw' in root:
-                for file in files:
-                    if file.endswith('.html'):
-                        file_path = os.path.join(root, file)
-                        # Extract domain from path
-                        path_parts = root.split(os.sep)
-                        domain = None
-                        for i, part in enumerate(path_parts):
-                            if part.startswith('www.') or part.count('.') >= 1:
-                                domain = part
-                                break
-                        
-                        if domain:
-                            html_files.append((file_path, domain))
+        # Same order as os.walk, a directory's files before its subdirectories'. The domain, the first
+        # path part that looks like a host name, is passed down instead of found again for every directory
+        def scan(path, domain):
+            try:
+                with os.scandir(path) as entries:
+                    entries = list(entries)
+            except OSError:
+                return
+            
+            in_raw = 'raw' in path
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir():
+                    # The extracted/metadata/cleaned trees next to raw/ only hold our own outputs
+                    if not entry.is_symlink() and (in_raw or entry.name not in OUTPUT_DIRS):
+                        subdirs.append(entry)
+                elif in_raw and domain and entry.name.endswith('.html'):
+                    html_files.append((entry.path, domain))
+            
+            for entry in subdirs:
+                scan(entry.path, domain or (entry.name if '.' in entry.name else None))
         
+        scan(CONTENT_DIR, None)
         return html_files
 
     def run(self, limit=None):
@@ -1486,6 +2003,7 @@ class TextExtractor:
         
         # Process each file with limit
         successfully_processed_count = 0
+        pending_files = []
         for file_path, domain in html_files:
             # Check if file is already processed before counting towards limit
             file_key = f"{domain}:{file_path}"
@@ -1498,19 +2016,20 @@ class TextExtractor:
             if limit and successfully_processed_count >= limit:
                 print(f"Reached limit of {limit} HTML files")
                 break
-                
-            # Store stats before processing
-            prev_successful = self.stats['successful_extractions']
             
-            # Process the file
-            self.process_html_file(file_path, domain)
+            pending_files.append((file_path, domain))
             
-            # Only count towards limit if extraction was successful
-            if self.stats['successful_extractions'] > prev_successful:
-                successfully_processed_count += 1
+            # With a limit, process only as many files at once as could still count towards it
+            # (only successful extractions count), so the same files get processed as one by one
+            if limit and len(pending_files) == limit - successfully_processed_count:
+                successfully_processed_count += self.process_html_files(pending_files)
+                pending_files = []
+        
+        successfully_processed_count += self.process_html_files(pending_files)
         
         # Save status and print summary
         self.save_status()
+        self.close_skip_logs()
         
         elapsed = time.time() - start_time
         print(f"\n=== Text Extractor Summary ===")
@@ -1529,7 +2048,7 @@ class TextExtractor:
         now = datetime.now()
         month_str = now.strftime("%Y-%m")
         month_dir = os.path.join(LOGS_DIR, month_str)
-        os.makedirs(month_dir, exist_ok=True)
+        self.make_directory(month_dir)
         
         summary_log_path = os.path.join(month_dir, "text_extractor_summary.log")
         
@@ -1560,37 +2079,86 @@ class TextExtractor:
         with open(summary_log_path, "a", encoding="utf-8") as f:
             f.write(log_entry)
 
-if __name__ == "__main__":
-    import sys
-    import time
+
+# HTML files handed to a worker process at a time by process_html_files
+EXTRACTION_CHUNK_SIZE = 8
+
+# Forked workers start with the parent's imports and compiled patterns already in memory, where
+# forkserver workers (the Linux default from Python 3.14) import everything again; elsewhere
+# fork is unavailable or unsafe, so the platform default is kept
+EXTRACTION_START_METHOD = 'fork' if sys.platform.startswith('linux') else None
+
+# Files a worker process extracts between clearing trafilatura's LRU caches,
+# which otherwise keep growing over a long run
+CACHE_RESET_INTERVAL = 1000
+
+# Extractor of the current worker process, and the files it extracted since the last cache reset
+worker_extractor = None
+worker_files_since_cache_reset = 0
+
+
+def init_extraction_worker(extraction_method, save_cleaned_html, fast_extraction):
+    """Build the worker's extractor, its status only ever holds the file being processed"""
+    global worker_extractor
+    worker_extractor = TextExtractor(extraction_method=extraction_method, save_cleaned_html=save_cleaned_html, workers=1,
+                                     fast_extraction=fast_extraction, load_processed_status=False)
+
+
+def extract_file(item):
+    """Process one (file_path, domain, previous status entry) item in a worker process, returns its status key and entry and the stats it added"""
+    global worker_files_since_cache_reset
+    file_path, domain, previous_status = item
+    file_key = f"{domain}:{file_path}"
+    worker_extractor.stats = dict.fromkeys(worker_extractor.stats, 0)
+    if previous_status:
+        worker_extractor.processed_status[file_key] = previous_status
+    worker_extractor.process_html_file(file_path, domain)
+    
+    # Resiliparse falls back to trafilatura for pages it finds no content in, only newspaper never loads it
+    worker_files_since_cache_reset += 1
+    if worker_files_since_cache_reset >= CACHE_RESET_INTERVAL and worker_extractor.extraction_method != 'newspaper':
+        from trafilatura.meta import reset_caches
+        reset_caches()
+        worker_files_since_cache_reset = 0
     
+    return file_key, worker_extractor.processed_status.pop(file_key), worker_extractor.stats
+
+
+if __name__ == "__main__":
     # Parse command line arguments
     limit = None
-    extraction_method = 'trafilatura'  # Default
+    extraction_method = DEFAULT_EXTRACTION_METHOD  # Default: resiliparse when installed
     save_cleaned_html = False  # Default
+    fast_extraction = False  # Default
     domain_filter = None  # Default
+    workers = None  # Default: one per CPU core
     
     if len(sys.argv) > 1:
         # Check for help flag first
         if sys.argv[1] in ['--help', '-h']:
             print("Text Extractor Script - Extracts clean article text from HTML files")
             print("")
-            print("Usage: python text_extractor.py [LIMIT] [METHOD] [--save-cleaned-html] [--domain DOMAIN]")
+            print("Usage: python text_extractor.py [LIMIT] [METHOD] [--save-cleaned-html] [--domain DOMAIN] [--workers N] [--fast]")
             print("")
             print("Parameters:")
             print("  LIMIT              (optional): Number of HTML files to process (leave empty for all)")
-            print("  METHOD             (optional): 'trafilatura' (default) or 'newspaper'")
+            print("  METHOD             (optional): 'resiliparse' (default, needs the resiliparse package), 'trafilatura' (default without it) or 'newspaper'")
             print("  --save-cleaned-html (optional): Save cleaned HTML files alongside original files")
             print("  --domain DOMAIN    (optional): Only process files from specified domain (e.g., digi24.ro, bzi.ro, www.digi24.ro)")
+            print("  --workers N        (optional): Number of parallel extraction processes (default: one per CPU core)")
+            print("  --fast             (optional): Skip trafilatura's fallback extractors, about 2x faster but less text on some pages")
             print("")
             print("Examples:")
-            print("  python text_extractor.py                                         # Process all files with trafilatura")
-            print("  python text_extractor.py 10                                      # Process 10 files with trafilatura")
+            print("  python text_extractor.py                                         # Process all files with the default method")
+            print("  python text_extractor.py 10                                      # Process 10 files with the default method")
             print("  python text_extractor.py 5 newspaper                             # Process 5 files with newspaper")
+            print("  python text_extractor.py 5 resiliparse                           # Process 5 files with resiliparse")
             print("  python text_extractor.py 10 trafilatura --save-cleaned-html      # Process 10 files and save cleaned HTML")
             print("  python text_extractor.py \"\" newspaper --save-cleaned-html        # Process all files with newspaper and save cleaned HTML")
             print("  python text_extractor.py 5 trafilatura --domain digi24.ro       # Process 5 files from digi24.ro only")
             print("  python text_extractor.py 2 --domain bzi.ro                       # Process 2 files from bzi.ro only")
+            print("  python text_extractor.py \"\" trafilatura --workers 4               # Process all files with 4 processes")
+            print("  python text_extractor.py \"\" trafilatura --fast                    # Process all files with trafilatura's fast mode")
             sys.exit(0)
         
         try:
@@ -1610,6 +2178,8 @@ if __name__ == "__main__":
         if arg == '--save-cleaned-html':
             save_cleaned_html = True
             print("💧 Cleaned HTML will be saved alongside extraction results")
+        elif arg == '--fast':
+            fast_extraction = True
         elif arg == '--domain':
             if i + 1 < len(sys.argv):
                 domain_filter = sys.argv[i + 1]
@@ -1617,15 +2187,29 @@ if __name__ == "__main__":
             else:
                 print("Error: --domain requires a domain value")
                 sys.exit(1)
-        elif arg.lower() in ['trafilatura', 'newspaper']:
+        elif arg == '--workers':
+            if i + 1 < len(sys.argv):
+                try:
+                    workers = int(sys.argv[i + 1])
+                    if workers <= 0:
+                        raise ValueError
+                except ValueError:
+                    print("Error: --workers must be a positive integer")
+                    sys.exit(1)
+                i += 1  # Skip the workers value
+            else:
+                print("Error: --workers requires a number of processes")
+                sys.exit(1)
+        elif arg.lower() in ['trafilatura', 'newspaper', 'resiliparse']:
             extraction_method = arg.lower()
         else:
             print(f"Error: Unknown argument '{arg}'")
-            print("Usage: python text_extractor.py [limit] [method] [--save-cleaned-html] [--domain DOMAIN]")
+            print("Usage: python text_extractor.py [limit] [method] [--save-cleaned-html] [--domain DOMAIN] [--workers N] [--fast]")
             sys.exit(1)
         
         i += 1
     
     print(f"Using extraction method: {extraction_method}")
-    extractor = TextExtractor(extraction_method=extraction_method, save_cleaned_html=save_cleaned_html, domain_filter=domain_filter)
+    extractor = TextExtractor(extraction_method=extraction_method, save_cleaned_html=save_cleaned_html, domain_filter=domain_filter, workers=workers,
+                              fast_extraction=fast_extraction)
     extractor.run(limit)
\ No newline at end of file